@@ -0,0 +1,10 @@
+"""
+Benchmarks dos engines de CRC.
+
+Execute a partir da raiz do repositório:
+    python -m benchmarks [--sizes 64 1518] [--engines table zlib] [--json saida.json]
+"""
+
+from benchmarks.engines import SIZES, generate_data, run_engine_benchmarks
+
+__all__ = ["SIZES", "generate_data", "run_engine_benchmarks"]
@@ -0,0 +1,109 @@
+"""Ponto de entrada: python -m benchmarks."""
+
+import argparse
+import json
+import platform
+import sys
+
+from benchmarks.correction import run_correction_benchmarks
+from benchmarks.engines import SIZES, run_engine_benchmarks
+from benchmarks.frames import run_frame_benchmarks, run_vlan_benchmarks
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark dos engines de CRC-32.")
+    parser.add_argument("--suite", nargs="+",
+                        choices=("engines", "frames", "correction", "vlan"),
+                        default=["engines"], help="conjuntos a executar")
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES),
+                        default=list(SIZES), help="tamanhos de entrada")
+    parser.add_argument("--engines", nargs="+", default=None,
+                        help="engines a medir (padrão: todos)")
+    parser.add_argument("--reflected", action="store_true",
+                        help="usa o modo refletido IEEE 802.3")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="semente dos dados gerados")
+    parser.add_argument("--max-seconds", type=float, default=10.0,
+                        help="pula combinações mais lentas que isso por chamada")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="tempo mínimo acumulado por medição")
+    parser.add_argument("--frames", type=int, default=20000,
+                        help="quadros IMIX por lote no conjunto 'frames'")
+    parser.add_argument("--json", metavar="ARQUIVO",
+                        help="grava os resultados em JSON ('-' para stdout)")
+    return parser.parse_args(argv)
+
+
+def format_row(result):
+    """Formata um resultado como linha da tabela de texto."""
+    head = f"{result['engine']:<10} {result['size_label']:>7}"
+    if result["skipped"]:
+        return f"{head}  (pulado: estimativa acima do limite)"
+    return (f"{head} {result['mb_per_s']:>10.2f} {result['ns_per_byte']:>10.2f}"
+            f" {result['frames_per_s']:>12.1f} {result['peak_memory'] / 1024:>10.1f}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = {label: SIZES[label] for label in args.sizes}
+    text = sys.stdout if args.json != "-" else sys.stderr
+    results = []
+    frame_results = []
+    correction_results = []
+    vlan_results = []
+    if "engines" in args.suite:
+        print(f"{'engine':<10} {'tamanho':>7} {'MB/s':>10} {'ns/byte':>10}"
+              f" {'quadros/s':>12} {'pico KiB':>10}", file=text)
+        for result in run_engine_benchmarks(sizes, args.engines, args.reflected,
+                                            args.seed, args.max_seconds,
+                                            args.min_time):
+            results.append(result)
+            print(format_row(result), file=text, flush=True)
+    if "frames" in args.suite:
+        print(f"\n{'método (IMIX)':<28} {'quadros/s':>12} {'ganho':>8}", file=text)
+        for result in run_frame_benchmarks(args.frames, args.reflected,
+                                           args.seed):
+            frame_results.append(result)
+            print(f"{result['method']:<28} {result['frames_per_s']:>12.0f}"
+                  f" {result['speedup']:>7.1f}x", file=text, flush=True)
+    if "vlan" in args.suite:
+        print(f"\n{'método (VLAN, 1518 B)':<28} {'quadros/s':>12} {'ganho':>8}",
+              file=text)
+        for result in run_vlan_benchmarks(reflected=args.reflected,
+                                          seed=args.seed):
+            vlan_results.append(result)
+            print(f"{result['method']:<28} {result['frames_per_s']:>12.0f}"
+                  f" {result['speedup']:>7.1f}x", file=text, flush=True)
+    if "correction" in args.suite:
+        print(f"\n{'correção':<22} {'tamanho':>8} {'tempo (ms)':>11} {'quadros/s':>12}",
+              file=text)
+        for result in run_correction_benchmarks(reflected=args.reflected,
+                                                seed=args.seed):
+            correction_results.append(result)
+            rate = result.get("frames_per_s")
+            print(f"{result['operation']:<22} {result['max_length']:>8}"
+                  f" {result['seconds'] * 1e3:>11.2f}"
+                  f" {'' if rate is None else f'{rate:.0f}':>12}",
+                  file=text, flush=True)
+    if args.json:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "results": results,
+            "frames": frame_results,
+            "correction": correction_results,
+            "vlan": vlan_results,
+        }
+        if args.json == "-":
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Medições da correção de erros baseada em síndromes."""
+
+import random
+import time
+
+from main import CRC32Calculator, _generate_syndromes
+
+# Tamanhos máximos de quadro usados na construção dos índices
+CORRECTION_LENGTHS = (64, 1518, 9018)
+
+
+def _corrupt(calculator, rng, size, bits):
+    """Gera um quadro com FCS correto e `bits` bits invertidos."""
+    data = rng.randbytes(size)
+    wire = bytearray(data + calculator.fcs_to_bytes(calculator.calculate_fcs(data)[1]))
+    for position in rng.sample(range(8 * len(wire)), bits):
+        wire[position // 8] ^= 1 << (position % 8)
+    return bytes(wire[:-4]), bytes(wire[-4:])
+
+
+def run_correction_benchmarks(frames=2000, reflected=False, seed=0):
+    """
+    Mede a construção do índice de síndromes e a correção de quadros.
+    Yields:
+        dict: resultado de cada medição
+    """
+    calculator = CRC32Calculator(reflected)
+    rng = random.Random(seed)
+    for length in CORRECTION_LENGTHS:
+        start = time.perf_counter()
+        _generate_syndromes(calculator.POLYNOMIAL, 8 * (length + 4))
+        elapsed = time.perf_counter() - start
+        yield {"operation": "index_build", "max_length": length,
+               "seconds": elapsed, "entries": 8 * (length + 4)}
+    for length in CORRECTION_LENGTHS:
+        corrupted = [_corrupt(calculator, rng, length, 1) for _ in range(frames)]
+        calculator.syndrome_index(length)  # índice já em cache
+        start = time.perf_counter()
+        for data, fcs in corrupted:
+            calculator.correct_single_bit(data, fcs, max_length=length)
+        elapsed = time.perf_counter() - start
+        yield {"operation": "correct_single_bit", "max_length": length,
+               "seconds": elapsed, "frames_per_s": frames / elapsed}
+    # Correção de 2 bits: O(n) consultas ao índice por quadro
+    for length in CORRECTION_LENGTHS[:2]:
+        corrupted = [_corrupt(calculator, rng, length, 2)
+                     for _ in range(frames // 10)]
+        start = time.perf_counter()
+        for data, fcs in corrupted:
+            calculator.correct_double_bit(data, fcs, max_length=length)
+        elapsed = time.perf_counter() - start
+        yield {"operation": "correct_double_bit", "max_length": length,
+               "seconds": elapsed, "frames_per_s": len(corrupted) / elapsed}
+    # Localização de rajadas: O(n) passos de multiplicação por x^-1
+    for length in CORRECTION_LENGTHS[:2]:
+        corrupted = [_corrupt(calculator, rng, length, 3)
+                     for _ in range(frames // 10)]
+        start = time.perf_counter()
+        for data, fcs in corrupted:
+            calculator.locate_bursts(data, fcs, max_burst=16)
+        elapsed = time.perf_counter() - start
+        yield {"operation": "locate_bursts", "max_length": length,
+               "seconds": elapsed, "frames_per_s": len(corrupted) / elapsed}
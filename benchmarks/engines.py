@@ -0,0 +1,119 @@
+"""Medições de vazão e memória dos engines do CRC32Calculator."""
+
+import random
+import time
+import tracemalloc
+
+from main import CRC32Calculator, np
+
+# Tamanhos de entrada: quadro mínimo, quadro máximo, jumbo, 1 MB e 100 MB
+SIZES = {
+    "64B": 64,
+    "1518B": 1518,
+    "9KB": 9 * 1024,
+    "1MB": 1 << 20,
+    "100MB": 100 << 20,
+}
+
+
+def generate_data(size, seed=0):
+    """Gera dados pseudoaleatórios determinísticos (sem acesso à rede)."""
+    return random.Random(seed).randbytes(size)
+
+
+def measure(func, data, min_time=0.2, repeat=3):
+    """
+    Mede o tempo por chamada de func(data).
+    Repete a chamada até acumular min_time segundos e usa a melhor de
+    `repeat` rodadas.
+    Returns:
+        float: segundos por chamada
+    """
+    func(data[:64])  # aquecimento (tabelas geradas sob demanda)
+    best = None
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time or calls == 0:
+            func(data)
+            calls += 1
+            elapsed = time.perf_counter() - start
+        per_call = elapsed / calls
+        if best is None or per_call < best:
+            best = per_call
+    return best
+
+
+def peak_memory(func, data):
+    """Retorna o pico de memória alocada (bytes) durante func(data)."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        func(data)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _engine_function(calculator, engine):
+    """Retorna a função de CRC correspondente ao engine."""
+    if engine == "direct":
+        return calculator._calculate_crc_direct
+    if engine == "table":
+        return calculator._calculate_crc_table
+    return lambda data: calculator.calculate_crc(data, engine=engine)
+
+
+def run_engine_benchmarks(sizes=None, engines=None, reflected=False, seed=0,
+                          max_seconds=10.0, min_time=0.2):
+    """
+    Executa os benchmarks de todos os engines em todos os tamanhos.
+    Combinações cuja duração estimada (a partir do tamanho anterior)
+    ultrapasse max_seconds por chamada são marcadas como puladas.
+    Args:
+        sizes: dict nome -> tamanho (padrão: SIZES)
+        engines: nomes dos engines (padrão: CRC32Calculator.ENGINES, sem
+            os que dependem do NumPy quando ele não está instalado)
+        reflected: usa o modo refletido IEEE 802.3
+        seed: semente dos dados gerados
+        max_seconds: limite estimado por chamada
+        min_time: tempo mínimo acumulado por medição
+    Yields:
+        dict: resultado de cada combinação engine/tamanho
+    """
+    if sizes is None:
+        sizes = SIZES
+    calculator = CRC32Calculator(reflected)
+    if engines is None:
+        engines = [engine for engine in calculator.ENGINES
+                   if np is not None or engine not in calculator.NUMPY_ENGINES]
+    ordered = sorted(sizes.items(), key=lambda item: item[1])
+    source = generate_data(ordered[-1][1], seed) if ordered else b""
+    for engine in engines:
+        func = _engine_function(calculator, engine)
+        ns_per_byte = None
+        for label, size in ordered:
+            data = source[:size]
+            result = {
+                "engine": engine,
+                "reflected": reflected,
+                "size_label": label,
+                "size": size,
+            }
+            if ns_per_byte is not None and ns_per_byte * size / 1e9 > max_seconds:
+                result["skipped"] = True
+                yield result
+                continue
+            seconds = measure(func, data, min_time)
+            ns_per_byte = seconds * 1e9 / size
+            result.update(
+                skipped=False,
+                seconds=seconds,
+                mb_per_s=size / seconds / 1e6,
+                ns_per_byte=ns_per_byte,
+                frames_per_s=1.0 / seconds,
+                peak_memory=peak_memory(func, data),
+                crc=func(data),
+            )
+            yield result
@@ -0,0 +1,107 @@
+"""Medições de validação de quadros em lote (tráfego IMIX)."""
+
+import random
+import time
+
+from main import CRC32Calculator, np
+
+# IMIX clássico: 7 quadros de 64 B, 4 de 594 B e 1 de 1518 B
+IMIX = (64,) * 7 + (594,) * 4 + (1518,)
+
+
+def generate_imix(count, seed=0, calculator=None):
+    """
+    Gera quadros IMIX determinísticos com FCS correto.
+    Returns:
+        tuple: (lista de quadros, lista de FCS)
+    """
+    if calculator is None:
+        calculator = CRC32Calculator()
+    rng = random.Random(seed)
+    frames = [rng.randbytes(rng.choice(IMIX)) for _ in range(count)]
+    fcs = [calculator.calculate_fcs(frame)[1] for frame in frames]
+    return frames, fcs
+
+
+def _frames_per_second(func, count, min_time):
+    """Executa func até acumular min_time e retorna quadros/s."""
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time or calls == 0:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return count * calls / elapsed
+
+
+def run_frame_benchmarks(count=20000, reflected=False, seed=0, min_time=0.5):
+    """
+    Compara validate_frame em laço com validate_frames em lote.
+    Yields:
+        dict: resultado de cada método
+    """
+    calculator = CRC32Calculator(reflected)
+    frames, fcs = generate_imix(count, seed, calculator)
+    methods = [("validate_frame", lambda: [
+        calculator.validate_frame(frame, value)
+        for frame, value in zip(frames, fcs)])]
+    if np is not None:
+        engines = ["lockstep", "zlib"]
+        methods += [(f"validate_frames[{engine}]",
+                     lambda engine=engine: calculator.validate_frames(
+                         frames, fcs, engine=engine))
+                    for engine in engines]
+    baseline = None
+    for name, func in methods:
+        rate = _frames_per_second(func, count, min_time)
+        if baseline is None:
+            baseline = rate
+        yield {
+            "method": name,
+            "reflected": reflected,
+            "frames": count,
+            "frames_per_s": rate,
+            "speedup": rate / baseline,
+        }
+
+
+def run_vlan_benchmarks(count=2000, reflected=False, seed=0, min_time=0.5):
+    """
+    Compara o push/pop de tag VLAN com atualização algébrica do FCS
+    (vlan_push/vlan_pop) ao recálculo completo, em quadros de 1518 B.
+    Yields:
+        dict: resultado de cada método
+    """
+    calculator = CRC32Calculator(reflected)
+    rng = random.Random(seed)
+    frames = [rng.randbytes(1514) for _ in range(count)]
+    fcs = [calculator.calculate_fcs(frame)[1] for frame in frames]
+    tag = b"\x81\x00\x00\x64"
+    tagged = [calculator.vlan_push(frame, value, 100)
+              for frame, value in zip(frames, fcs)]
+
+    def recompute(engine):
+        for frame in frames:
+            calculator.calculate_crc(frame[:12] + tag + frame[12:], engine=engine)
+
+    methods = [
+        ("recálculo[padrão]", lambda: recompute(None)),
+        ("recálculo[zlib]", lambda: recompute("zlib")),
+        ("vlan_push", lambda: [calculator.vlan_push(frame, value, 100)
+                               for frame, value in zip(frames, fcs)]),
+        ("vlan_pop", lambda: [calculator.vlan_pop(frame, value)
+                              for frame, value in tagged]),
+    ]
+    baseline = None
+    for name, func in methods:
+        rate = _frames_per_second(func, count, min_time)
+        if baseline is None:
+            baseline = rate
+        yield {
+            "method": name,
+            "reflected": reflected,
+            "frames": count,
+            "frames_per_s": rate,
+            "speedup": rate / baseline,
+        }
@@ -1,19 +1,271 @@
 """@author: Bruno Augusto Furquim"""
 
+import argparse
+import csv
+import errno
+import io
+import json
+import mmap
+import operator
+import os
+import stat
 import struct
+import sys
+import threading
+import zlib
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: apenas as APIs em lote dependem dele
+    np = None
+
+# Tamanho do buffer de leitura reaproveitado nas funções de arquivo
+READ_BLOCK_SIZE = 1 << 20
+
+# Detecção de sequências de zeros: granularidade da comparação e tamanho
+# mínimo a partir do qual extend_zeros é mais barato que o engine
+ZERO_BLOCK_SIZE = 4096
+ZERO_RUN_MIN = 4 * ZERO_BLOCK_SIZE
+_ZERO_BLOCK = bytes(ZERO_BLOCK_SIZE)
+_ZERO_VIEW = memoryview(_ZERO_BLOCK)
+
+# Tag 802.1Q: inserida após os endereços MAC de destino e origem
+VLAN_OFFSET = 12
+VLAN_TPIDS = (0x8100, 0x88A8)
+
+# Engine "lanes": tamanho mínimo do buffer (abaixo dele o slicing-by-16 é
+# mais rápido), tamanho mínimo de cada faixa e quantidade máxima de faixas,
+# medidos com python -m benchmarks
+LANES_MIN_SIZE = 32 * 1024
+LANES_MIN_LENGTH = 128
+LANES_MAX = 4096
+
+# Engine "auto" (modo MSB-first): fragmentos de até este tamanho usam a
+# tabela; acima, o custo fixo do espelhamento para o zlib compensa. Os
+# fragmentos maiores são espelhados em blocos de IOV_MIRROR_BLOCK bytes
+AUTO_TABLE_MAX = 4
+IOV_MIRROR_BLOCK = 64 * 1024
+
+# Correção de erros: tamanho máximo padrão do quadro (bytes) e limites de
+# bits de dados em que o CRC-32 do IEEE 802.3 tem distância de Hamming 5 e 4
+CORRECTION_MAX_LENGTH = 1518
+HD5_MAX_DATA_BITS = 2974
+HD4_MAX_DATA_BITS = 91607
+
+# Tabela de inversão de bits de cada byte (bit 7 <-> bit 0, ...)
+BIT_REVERSE_TABLE = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
+
+def reflect32(value):
+    """Inverte a ordem dos 32 bits de um valor."""
+    return int.from_bytes(
+        value.to_bytes(4, 'little').translate(BIT_REVERSE_TABLE), 'big')
+
+
+def multmodp(a, b, polynomial):
+    """
+    Multiplica dois polinômios de 32 bits módulo P (convenção MSB-first:
+    o bit 31 é o coeficiente de x^31).
+    """
+    product = 0
+    while a:
+        if a & 1:
+            product ^= b
+        a >>= 1
+        if b & 0x80000000:
+            b = ((b << 1) ^ polynomial) & 0xFFFFFFFF
+        else:
+            b <<= 1
+    return product
+
+
+# Tabelas x^(8*2^k) mod P por polinômio (potências do operador de shift)
+_X8N_TABLES = {}
+
+
+def _x8n_table(polynomial):
+    """Retorna a tabela x^(8*2^k) mod P, k = 0..63."""
+    table = _X8N_TABLES.get(polynomial)
+    if table is None:
+        table = [0x100]  # x^8
+        for _ in range(63):
+            table.append(multmodp(table[-1], table[-1], polynomial))
+        _X8N_TABLES[polynomial] = table
+    return table
+
+
+@lru_cache(maxsize=1024)
+def x8nmodp(n, polynomial):
+    """
+    Calcula x^(8*n) mod P em O(log n) usando a tabela de potências.
+    Equivale ao operador que avança o registrador por n bytes nulos.
+    """
+    table = _x8n_table(polynomial)
+    product = 1  # x^0
+    k = 0
+    while n:
+        if n & 1:
+            product = multmodp(table[k], product, polynomial)
+        n >>= 1
+        k += 1
+    return product
+
+
+def _require_numpy():
+    """Garante que o NumPy está disponível para as APIs em lote."""
+    if np is None:
+        raise ImportError("Esta operação requer NumPy (pip install numpy)")
+
+
+def _multmodp_array(values, constant, polynomial):
+    """Versão vetorizada de multmodp: multiplica cada valor pela constante."""
+    product = np.zeros_like(values)
+    values = values.copy()
+    poly = np.uint32(polynomial)
+    while constant:
+        if constant & 1:
+            product ^= values
+        constant >>= 1
+        carry = (values >> 31).astype(bool)
+        values <<= 1
+        values[carry] ^= poly
+    return product
+
+
+def _reflect32_array(values):
+    """Versão vetorizada de reflect32 para arrays uint32."""
+    reverse = np.frombuffer(BIT_REVERSE_TABLE, dtype=np.uint8).astype(np.uint32)
+    return ((reverse[values & 0xFF] << 24) | (reverse[(values >> 8) & 0xFF] << 16)
+            | (reverse[(values >> 16) & 0xFF] << 8) | reverse[values >> 24])
+
+
+def _generate_syndromes(polynomial, max_bits):
+    """
+    Gera o índice síndrome -> grau: {x^D mod P: D} para D < max_bits.
+    Pela linearidade do CRC, inverter o bit de grau D da palavra-código
+    (dados + FCS) altera o CRC exatamente em x^D mod P.
+    """
+    syndromes = {}
+    value = 1  # x^0
+    for degree in range(max_bits):
+        syndromes[value] = degree
+        if value & 0x80000000:
+            value = ((value << 1) ^ polynomial) & 0xFFFFFFFF
+        else:
+            value <<= 1
+    return syndromes
+
+
+def _length_class(size):
+    """Classe de tamanho (potência de 2, mínimo 64 bytes) de um quadro."""
+    length = 64
+    while length < size:
+        length <<= 1
+    return length
+
+
+# Resultado de uma tentativa de correção. status: "valid", "corrected",
+# "ambiguous" ou "uncorrectable"; positions: bits invertidos (posição na
+# ordem de transmissão, contando o FCS após os dados) ou, se ambíguo, os
+# pares candidatos; confident: a correção é única supondo no máximo dois
+# bits com erro.
+Correction = namedtuple("Correction", "status data fcs positions confident")
+
+# Rajada de erro candidata: start é a posição (ordem de transmissão) do
+# primeiro bit invertido; pattern traz os bits invertidos, o primeiro
+# transmitido no bit mais significativo (bits inicial e final sempre 1).
+Burst = namedtuple("Burst", "start length pattern")
+
+
+class TableRegistry:
+    """
+    Registro de tabelas de lookup compartilhado pelo processo.
+    Cada tabela é gerada uma única vez por chave (ex.: por especificação
+    de CRC) e reaproveitada por todas as instâncias; a geração é
+    protegida por lock para uso seguro entre threads.
+    """
+    
+    def __init__(self):
+        self._tables = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key, factory):
+        """
+        Retorna a tabela associada à chave, gerando-a com factory() na
+        primeira vez.
+        """
+        table = self._tables.get(key)
+        if table is None:
+            with self._lock:
+                table = self._tables.get(key)
+                if table is None:
+                    table = factory()
+                    self._tables[key] = table
+        return table
+    
+    def __len__(self):
+        return len(self._tables)
+
+
+TABLE_REGISTRY = TableRegistry()
+
 
 class CRC32Calculator:
-    # Polinômio padrão usado em Ethernet (0x04C11DB7)
+    # Polinômio padrão usado em Ethernet (0x04C11DB7). No modo padrão o
+    # cálculo é MSB-first (CRC-32/BZIP2); com reflected=True usa-se a forma
+    # LSB-first (0xEDB88320) transmitida pelas placas IEEE 802.3.
     POLYNOMIAL = 0x04C11DB7
+    REFLECTED_POLYNOMIAL = 0xEDB88320
     INITIAL_VALUE = 0xFFFFFFFF
     FINAL_XOR = 0xFFFFFFFF
     
-    def __init__(self):
-        self.crc_table = self._generate_crc_table()
+    # Engines disponíveis em calculate_crc(data, engine=...)
+    ENGINES = ("direct", "table", "slice8", "slice16", "zlib", "lanes", "auto")
+    # Engines que dependem do NumPy
+    NUMPY_ENGINES = ("lanes",)
+    _ENGINE_METHODS = {
+        "direct": "_update_direct",
+        "table": "_update_table",
+        "slice8": "_update_slice8",
+        "slice16": "_update_slice16",
+        "zlib": "_update_zlib",
+        "lanes": "_update_lanes",
+        "auto": "_update_auto",
+    }
+    
+    # Apenas duas referências por instância; as tabelas são compartilhadas
+    __slots__ = ("reflected", "crc_table")
+    
+    def __init__(self, reflected=False):
+        """
+        Args:
+            reflected: Se True, calcula o CRC refletido do IEEE 802.3
+                (LSB-first, FCS em little-endian no fio)
+        """
+        self.reflected = reflected
+        # Tabela gerada uma vez por processo (e por polinômio/modo) e
+        # compartilhada por todas as instâncias e subclasses
+        self.crc_table = TABLE_REGISTRY.get(
+            ("crc32", self.POLYNOMIAL, reflected), self._generate_crc_table)
     
     def _generate_crc_table(self):
         """Gera tabela de lookup para cálculo rápido de CRC."""
         table = []
+        if self.reflected:
+            for i in range(256):
+                crc = i
+                for _ in range(8):
+                    if crc & 1:
+                        crc = (crc >> 1) ^ self.REFLECTED_POLYNOMIAL
+                    else:
+                        crc = crc >> 1
+                table.append(crc)
+            return array('I', table)
         
         for i in range(256):
             crc = i << 24
@@ -24,73 +276,1391 @@ class CRC32Calculator:
                     crc = crc << 1
                 crc &= 0xFFFFFFFF
             table.append(crc)
-        return table
+        return array('I', table)
     
     def _calculate_crc_direct(self, data):
         """
         Calcula CRC-32 de forma direta (bit-a-bit).
         """
-        crc = self.INITIAL_VALUE
+        return self._update_direct(self.INITIAL_VALUE, data) ^ self.FINAL_XOR
+    
+    def _calculate_crc_table(self, data):
+        """
+        Calcula CRC-32 usando tabela de lookup (otimizado).
+        """
+        return self._update_table(self.INITIAL_VALUE, data) ^ self.FINAL_XOR
+    
+    def _update_table(self, crc, data):
+        """
+        Avança o registrador CRC byte a byte usando a tabela de lookup.
+        Args:
+            crc: valor atual do registrador (sem XOR final)
+            data: bytes a serem processados
+        Returns:
+            int: Novo valor do registrador
+        """
+        table = self.crc_table
+        if self.reflected:
+            # Implementação de referência; o caminho rápido é o zlib
+            for byte in data:
+                crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+            return crc
+        for byte in data:
+            table_index = (crc >> 24) ^ byte
+            crc = ((crc << 8) ^ table[table_index]) & 0xFFFFFFFF
+        return crc
+    
+    def _generate_slice_tables(self, count):
+        """
+        Gera as tabelas derivadas para slicing-by-N.
+        A tabela k fornece o efeito de um byte seguido de k bytes nulos,
+        de modo que N bytes podem ser consumidos por iteração.
+        Args:
+            count: número de tabelas (8 ou 16)
+        Returns:
+            tuple: tabelas ordenadas da mais "distante" (N-1) até a 0
+        """
+        table = self.crc_table
+        tables = [table]
+        for _ in range(count - 1):
+            previous = tables[-1]
+            if self.reflected:
+                tables.append(array('I', [(value >> 8) ^ table[value & 0xFF]
+                                          for value in previous]))
+            else:
+                tables.append(array('I', [
+                    ((value << 8) & 0xFFFFFFFF) ^ table[value >> 24]
+                    for value in previous]))
+        return tuple(reversed(tables))
+    
+    def _slice_tables(self, count):
+        """Retorna (gerando sob demanda) as tabelas de slicing-by-N."""
+        return TABLE_REGISTRY.get(
+            ("slice", self.POLYNOMIAL, self.reflected, count),
+            lambda: self._generate_slice_tables(count))
+    
+    def _update_slice8(self, crc, data):
+        """
+        Avança o registrador CRC consumindo 8 bytes por iteração.
+        Os bytes são lidos como palavras big-endian (MSB primeiro),
+        compatível com o polinômio não refletido; no modo refletido as
+        palavras são little-endian.
+        """
+        t7, t6, t5, t4, t3, t2, t1, t0 = self._slice_tables(8)
+        view = memoryview(data).cast('B')
+        blocks = len(view) - len(view) % 8
+        if self.reflected:
+            for word, b4, b5, b6, b7 in struct.iter_unpack('<I4B', view[:blocks]):
+                crc ^= word
+                crc = (t7[crc & 0xFF] ^ t6[(crc >> 8) & 0xFF]
+                       ^ t5[(crc >> 16) & 0xFF] ^ t4[crc >> 24]
+                       ^ t3[b4] ^ t2[b5] ^ t1[b6] ^ t0[b7])
+            return self._update_table(crc, view[blocks:])
+        for word, b4, b5, b6, b7 in struct.iter_unpack('>I4B', view[:blocks]):
+            crc ^= word
+            crc = (t7[crc >> 24] ^ t6[(crc >> 16) & 0xFF]
+                   ^ t5[(crc >> 8) & 0xFF] ^ t4[crc & 0xFF]
+                   ^ t3[b4] ^ t2[b5] ^ t1[b6] ^ t0[b7])
+        return self._update_table(crc, view[blocks:])
+    
+    def _update_slice16(self, crc, data):
+        """
+        Avança o registrador CRC consumindo 16 bytes por iteração.
+        """
+        (t15, t14, t13, t12, t11, t10, t9, t8,
+         t7, t6, t5, t4, t3, t2, t1, t0) = self._slice_tables(16)
+        view = memoryview(data).cast('B')
+        blocks = len(view) - len(view) % 16
+        if self.reflected:
+            for (word, b4, b5, b6, b7, b8, b9, b10, b11,
+                 b12, b13, b14, b15) in struct.iter_unpack('<I12B', view[:blocks]):
+                crc ^= word
+                crc = (t15[crc & 0xFF] ^ t14[(crc >> 8) & 0xFF]
+                       ^ t13[(crc >> 16) & 0xFF] ^ t12[crc >> 24]
+                       ^ t11[b4] ^ t10[b5] ^ t9[b6] ^ t8[b7]
+                       ^ t7[b8] ^ t6[b9] ^ t5[b10] ^ t4[b11]
+                       ^ t3[b12] ^ t2[b13] ^ t1[b14] ^ t0[b15])
+            return self._update_table(crc, view[blocks:])
+        for (word, b4, b5, b6, b7, b8, b9, b10, b11,
+             b12, b13, b14, b15) in struct.iter_unpack('>I12B', view[:blocks]):
+            crc ^= word
+            crc = (t15[crc >> 24] ^ t14[(crc >> 16) & 0xFF]
+                   ^ t13[(crc >> 8) & 0xFF] ^ t12[crc & 0xFF]
+                   ^ t11[b4] ^ t10[b5] ^ t9[b6] ^ t8[b7]
+                   ^ t7[b8] ^ t6[b9] ^ t5[b10] ^ t4[b11]
+                   ^ t3[b12] ^ t2[b13] ^ t1[b14] ^ t0[b15])
+        return self._update_table(crc, view[blocks:])
+    
+    def _update_zlib(self, crc, data):
+        """
+        Avança o registrador CRC usando zlib.crc32 (implementado em C).
+        O zlib calcula a versão refletida do mesmo polinômio; espelhando
+        os bits de cada byte de entrada e do registrador obtém-se
+        exatamente o CRC MSB-first desta classe. No modo refletido o
+        zlib é usado diretamente, sem cópias.
+        """
+        if self.reflected:
+            return zlib.crc32(data, crc ^ 0xFFFFFFFF) ^ 0xFFFFFFFF
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+        mirrored = data.translate(BIT_REVERSE_TABLE)
+        # zlib recebe e devolve o valor já complementado
+        result = zlib.crc32(mirrored, reflect32(crc) ^ 0xFFFFFFFF)
+        return reflect32(result ^ 0xFFFFFFFF)
+    
+    def _update_auto(self, crc, data):
+        """
+        Avança o registrador escolhendo o engine mais rápido para o tamanho
+        dos dados: zlib no modo refletido (sem cópias) e, no modo
+        MSB-first, tabela para fragmentos mínimos e zlib para os demais.
+        """
+        if self.reflected or len(data) > AUTO_TABLE_MAX:
+            return self._update_zlib(crc, data)
+        return self._update_table(crc, data)
+    
+    def _update_direct(self, crc, data):
+        """
+        Avança o registrador CRC bit a bit (sem tabela).
+        """
+        if self.reflected:
+            for byte in data:
+                crc ^= byte
+                for _ in range(8):
+                    if crc & 1:
+                        crc = (crc >> 1) ^ self.REFLECTED_POLYNOMIAL
+                    else:
+                        crc = crc >> 1
+            return crc
         for byte in data:
             crc ^= byte << 24
-            
             for _ in range(8):
                 if crc & 0x80000000:
                     crc = (crc << 1) ^ self.POLYNOMIAL
                 else:
                     crc = crc << 1
                 crc &= 0xFFFFFFFF
-        return crc ^ self.FINAL_XOR
+        return crc
     
-    def _calculate_crc_table(self, data):
+    def update_register(self, crc, data, engine="table"):
         """
-        Calcula CRC-32 usando tabela de lookup (otimizado).
+        Avança o registrador CRC sobre os dados com o engine escolhido.
+        Args:
+            crc: valor atual do registrador (sem XOR final)
+            data: bytes a serem processados
+            engine: nome do engine (ver ENGINES)
+        Returns:
+            int: Novo valor do registrador
         """
-        crc = self.INITIAL_VALUE
-        for byte in data:
-            table_index = (crc >> 24) ^ byte
-            crc = ((crc << 8) ^ self.crc_table[table_index]) & 0xFFFFFFFF
-        return crc ^ self.FINAL_XOR
+        try:
+            method = self._ENGINE_METHODS[engine]
+        except KeyError:
+            raise ValueError(f"Engine desconhecido: {engine!r}") from None
+        return getattr(self, method)(crc, data)
     
-    def calculate_crc(self, data, use_table=True):
+    def calculate_crc(self, data, use_table=True, engine=None):
         """
         Calcula o CRC-32 dos dados fornecidos.
         Args:
             data: bytes a serem processados
-            use_table: Se True, usa tabela de lookup (mais rápido)
+            use_table: Se True, usa tabela de lookup (mais rápido); no
+                modo refletido usa o zlib
+            engine: engine explícito (ver ENGINES); se informado,
+                tem precedência sobre use_table
         Returns:
             int: Valor do CRC-32 calculado
         """
+        if engine is None and use_table and self.reflected:
+            engine = "zlib"
+        if engine is not None:
+            return self.update_register(self.INITIAL_VALUE, data, engine) ^ self.FINAL_XOR
         if use_table:
             return self._calculate_crc_table(data)
         else:
             return self._calculate_crc_direct(data)
     
+    def calculate_crc_iov(self, buffers, engine="auto"):
+        """
+        Calcula o CRC-32 da concatenação de vários buffers (ex.: cabeçalho,
+        payload e trailer) sem juntá-los: o registrador é passado de um
+        fragmento ao seguinte.
+        Args:
+            buffers: iterável de objetos com protocolo de buffer (bytes,
+                bytearray, memoryview, fatias de mmap, ...)
+            engine: engine usado em cada fragmento; com "auto" (padrão)
+                o engine é escolhido pelo tamanho de cada fragmento (ver
+                _crc_iov_auto)
+        Returns:
+            int: Valor do CRC-32 calculado
+        """
+        if engine == "auto":
+            return self._crc_iov_auto(buffers)
+        register = self.INITIAL_VALUE
+        for buffer in buffers:
+            view = memoryview(buffer)
+            if view.ndim != 1 or view.itemsize != 1:
+                view = view.cast('B')
+            register = self.update_register(register, view, engine)
+        return register ^ self.FINAL_XOR
+    
+    def _crc_iov_auto(self, buffers):
+        """
+        Caminho de calculate_crc_iov com o engine "auto". O registrador
+        fica no domínio do zlib (refletido e complementado) entre os
+        fragmentos, então é espelhado uma única vez por mensagem.
+        No modo refletido os buffers vão direto ao zlib, sem cópias. No
+        MSB-first, fragmentos de até AUTO_TABLE_MAX bytes são lidos sem
+        cópia pela tabela refletida (com os bytes espelhados um a um); os
+        maiores são espelhados para o zlib em blocos de IOV_MIRROR_BLOCK
+        bytes, o que limita a cópia temporária ao tamanho do bloco.
+        """
+        value = self.INITIAL_VALUE ^ 0xFFFFFFFF
+        if self.reflected:
+            for buffer in buffers:
+                value = zlib.crc32(buffer, value)
+            return value ^ 0xFFFFFFFF ^ self.FINAL_XOR
+        table = type(self)(reflected=True).crc_table
+        value = reflect32(value)
+        for buffer in buffers:
+            if isinstance(buffer, (bytes, bytearray)) and len(buffer) <= IOV_MIRROR_BLOCK:
+                if len(buffer) > AUTO_TABLE_MAX:
+                    # Uma única cópia: o espelhamento do próprio fragmento
+                    value = zlib.crc32(buffer.translate(BIT_REVERSE_TABLE), value)
+                    continue
+                view = buffer
+            else:
+                view = memoryview(buffer)
+                if view.ndim != 1 or view.itemsize != 1:
+                    view = view.cast('B')
+            size = len(view)
+            if size <= AUTO_TABLE_MAX:
+                register = value ^ 0xFFFFFFFF
+                for byte in view:
+                    register = (register >> 8) ^ table[
+                        (register ^ BIT_REVERSE_TABLE[byte]) & 0xFF]
+                value = register ^ 0xFFFFFFFF
+                continue
+            for start in range(0, size, IOV_MIRROR_BLOCK):
+                block = bytes(view[start:start + IOV_MIRROR_BLOCK])
+                value = zlib.crc32(block.translate(BIT_REVERSE_TABLE), value)
+        return reflect32(value ^ 0xFFFFFFFF) ^ self.FINAL_XOR
+    
+    def _update_stream(self, crc, f, engine, limit=None,
+                       block_size=READ_BLOCK_SIZE):
+        """
+        Avança o registrador lendo um arquivo binário com readinto em um
+        único buffer pré-alocado e reaproveitado.
+        Args:
+            crc: valor atual do registrador
+            f: arquivo binário aberto (aceita pipes e stdin)
+            engine: engine usado em cada bloco
+            limit: quantidade exata de bytes a ler (None = até o EOF)
+        Returns:
+            int: Novo valor do registrador
+        """
+        if limit is not None:
+            block_size = max(1, min(block_size, limit))
+        buffer = bytearray(block_size)
+        view = memoryview(buffer)
+        remaining = limit
+        while remaining is None or remaining:
+            size = block_size if remaining is None else min(remaining, block_size)
+            count = f.readinto(view[:size])
+            if not count:
+                if remaining is not None:
+                    raise EOFError("Arquivo truncado durante a leitura")
+                break
+            crc = self._update_zero_runs(crc, view[:count], engine)
+            if remaining is not None:
+                remaining -= count
+        return crc
+    
+    def _update_mmap(self, crc, f, engine, block_size=READ_BLOCK_SIZE):
+        """
+        Avança o registrador mapeando o arquivo em memória e passando
+        fatias memoryview (sem cópia) ao engine.
+        Returns:
+            int: Novo valor do registrador, ou None se o arquivo não
+            puder ser mapeado (pipe, arquivo vazio, etc.)
+        """
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, io.UnsupportedOperation):
+            return None
+        view = memoryview(mapped)
+        try:
+            for start in range(0, len(view), block_size):
+                crc = self._update_zero_runs(
+                    crc, view[start:start + block_size], engine)
+        finally:
+            view.release()
+            mapped.close()
+        return crc
+    
+    def _update_sparse(self, crc, f, engine):
+        """
+        Avança o registrador percorrendo só as regiões com dados de um
+        arquivo esparso (os.SEEK_DATA / os.SEEK_HOLE); os buracos são
+        atravessados com extend_zeros, sem leitura. Como no caminho com
+        buffer, a leitura começa na posição atual do arquivo e termina no
+        fim dele.
+        Returns:
+            int: Novo valor do registrador, ou None se o sistema ou o
+            arquivo não informar as regiões (pipe, SO sem SEEK_DATA, etc.)
+        """
+        if not hasattr(os, "SEEK_DATA"):
+            return None
+        try:
+            fd = f.fileno()
+            size = os.fstat(fd).st_size
+            start = f.tell()
+            os.lseek(fd, start, os.SEEK_DATA)
+        except OSError as error:
+            if getattr(error, "errno", None) != errno.ENXIO:
+                return None
+            # ENXIO: só há buraco da posição atual até o fim do arquivo
+        except (AttributeError, ValueError):
+            return None
+        # As leituras usam o arquivo sem buffer, cuja posição é a do fd
+        raw = getattr(f, "raw", f)
+        position = start
+        while position < size:
+            try:
+                data = os.lseek(fd, position, os.SEEK_DATA)
+            except OSError as error:
+                if error.errno != errno.ENXIO:
+                    raise
+                data = size  # só resta buraco até o fim
+            crc = self.extend_zeros(crc, data - position)
+            if data >= size:
+                break
+            hole = os.lseek(fd, data, os.SEEK_HOLE)
+            raw.seek(data)
+            crc = self._update_stream(crc, raw, engine, limit=hole - data)
+            position = hole
+        # Descarta o buffer do objeto de alto nível, agora desatualizado
+        f.seek(0, os.SEEK_END)
+        return crc
+    
+    def crc_file(self, source, use_mmap=True, engine="zlib", sparse=False):
+        """
+        Calcula o CRC-32 de um arquivo sem carregá-lo inteiro na memória.
+        Args:
+            source: caminho do arquivo, "-" para stdin ou arquivo binário
+                já aberto
+            use_mmap: Se True, tenta mapear o arquivo com mmap; fontes
+                não mapeáveis usam leitura com buffer reaproveitado
+            engine: engine usado em cada bloco
+            sparse: Se True, lê apenas as regiões com dados de arquivos
+                esparsos e atravessa os buracos algebricamente; o resultado
+                é o mesmo do conteúdo lógico completo (para arquivos já
+                abertos, a partir da posição atual)
+        Returns:
+            int: Valor do CRC-32 calculado
+        """
+        if source == "-":
+            return self._crc_fileobj(sys.stdin.buffer, False, engine)
+        if isinstance(source, (str, bytes, os.PathLike)):
+            with open(source, 'rb') as f:
+                return self._crc_fileobj(f, use_mmap, engine, sparse)
+        return self._crc_fileobj(source, False, engine, sparse)
+    
+    def _crc_fileobj(self, f, use_mmap, engine, sparse=False):
+        """Calcula o CRC-32 de um arquivo binário aberto."""
+        crc = None
+        if sparse:
+            crc = self._update_sparse(self.INITIAL_VALUE, f, engine)
+        if crc is None and use_mmap:
+            crc = self._update_mmap(self.INITIAL_VALUE, f, engine)
+        if crc is None:
+            crc = self._update_stream(self.INITIAL_VALUE, f, engine)
+        return crc ^ self.FINAL_XOR
+    
+    def combine(self, crc_a, crc_b, len_b):
+        """
+        Calcula CRC(A||B) a partir de CRC(A), CRC(B) e len(B),
+        sem reprocessar os dados (equivalente ao crc32_combine do zlib
+        para a convenção não refletida).
+        Args:
+            crc_a: CRC-32 do primeiro bloco
+            crc_b: CRC-32 do segundo bloco
+            len_b: tamanho do segundo bloco em bytes
+        Returns:
+            int: CRC-32 da concatenação
+        """
+        if len_b <= 0:
+            return crc_a
+        # O valor inicial de B é substituído pelo registrador final de A
+        register = crc_a ^ self.FINAL_XOR ^ self.INITIAL_VALUE
+        return self.extend_zeros(register, len_b) ^ crc_b
+    
+    def _resize_delta(self, prefix, segment, suffix_len):
+        """
+        Diferença entre os CRCs de A||S||B e A||B (A = prefix, S = segment,
+        len(B) = suffix_len). Com r(X) o registrador após X a partir do
+        valor inicial, o registrador final é shift(r(A||S), |B|) XOR R0(B)
+        em um caso e shift(r(A), |B|) XOR R0(B) no outro; o termo do
+        sufixo se cancela e resta um único shift.
+        """
+        register = self.update_register(self.INITIAL_VALUE, prefix, "zlib")
+        extended = self.update_register(register, segment, "zlib")
+        return self.extend_zeros(register ^ extended, suffix_len)
+    
+    def insert_bytes(self, old_crc, total_len, offset, prefix, inserted):
+        """
+        Calcula o CRC após inserir bytes em uma posição da mensagem, sem
+        processar o sufixo: combina o registrador do prefixo, os bytes
+        inseridos e o tamanho do sufixo em O(offset + len(inserted) +
+        log(total_len)).
+        Args:
+            old_crc: CRC-32 da mensagem original
+            total_len: tamanho da mensagem original em bytes
+            offset: posição da inserção
+            prefix: os `offset` primeiros bytes da mensagem
+            inserted: bytes inseridos
+        Returns:
+            int: CRC-32 da mensagem com os bytes inseridos
+        """
+        if len(prefix) != offset or offset > total_len:
+            raise ValueError("prefix deve ter exatamente offset bytes")
+        return old_crc ^ self._resize_delta(prefix, inserted, total_len - offset)
+    
+    def delete_bytes(self, old_crc, total_len, offset, prefix, removed):
+        """
+        Calcula o CRC após remover bytes de uma posição da mensagem,
+        processando só o prefixo e os bytes removidos.
+        Args:
+            old_crc: CRC-32 da mensagem original
+            total_len: tamanho da mensagem original em bytes
+            offset: posição do primeiro byte removido
+            prefix: os `offset` primeiros bytes da mensagem
+            removed: bytes removidos
+        Returns:
+            int: CRC-32 da mensagem sem os bytes removidos
+        """
+        suffix_len = total_len - offset - len(removed)
+        if len(prefix) != offset or suffix_len < 0:
+            raise ValueError("prefix deve ter exatamente offset bytes")
+        return old_crc ^ self._resize_delta(prefix, removed, suffix_len)
+    
+    def vlan_push(self, frame, fcs, tci, tpid=0x8100):
+        """
+        Insere uma tag 802.1Q após os endereços MAC e atualiza o FCS sem
+        reprocessar o quadro.
+        Args:
+            frame: quadro sem o FCS
+            fcs: FCS do quadro
+            tci: Tag Control Information (PCP, DEI e VLAN ID)
+            tpid: identificador da tag (0x8100 ou 0x88A8)
+        Returns:
+            tuple: (quadro com a tag, novo FCS)
+        """
+        if len(frame) < VLAN_OFFSET:
+            raise ValueError("Quadro menor que os endereços MAC")
+        tag = struct.pack(">HH", tpid, tci)
+        prefix = frame[:VLAN_OFFSET]
+        crc = self.insert_bytes(self._fcs_to_crc(fcs), len(frame),
+                                VLAN_OFFSET, prefix, tag)
+        return prefix + tag + frame[VLAN_OFFSET:], self._fcs_to_crc(crc)
+    
+    def vlan_pop(self, frame, fcs):
+        """
+        Remove a tag 802.1Q (ou 802.1ad) externa e atualiza o FCS sem
+        reprocessar o quadro.
+        Args:
+            frame: quadro sem o FCS
+            fcs: FCS do quadro
+        Returns:
+            tuple: (quadro sem a tag, novo FCS, TCI removido)
+        """
+        tag = frame[VLAN_OFFSET:VLAN_OFFSET + 4]
+        if len(tag) < 4 or struct.unpack(">H", tag[:2])[0] not in VLAN_TPIDS:
+            raise ValueError("Quadro sem tag VLAN")
+        prefix = frame[:VLAN_OFFSET]
+        crc = self.delete_bytes(self._fcs_to_crc(fcs), len(frame),
+                                VLAN_OFFSET, prefix, tag)
+        return (prefix + frame[VLAN_OFFSET + 4:], self._fcs_to_crc(crc),
+                struct.unpack(">H", tag[2:])[0])
+    
+    def _fcs_to_crc(self, value):
+        """Converte FCS em CRC (e vice-versa): a relação é uma involução."""
+        return value if self.reflected else value ^ 0xFFFFFFFF
+    
+    def patch(self, old_crc, total_len, offset, old_bytes, new_bytes):
+        """
+        Atualiza o CRC de uma mensagem após sobrescrever bytes, sem
+        reprocessá-la. Pela linearidade, CRC(M') = CRC(M) XOR o CRC (com
+        registrador inicial zero) da diferença old XOR new deslocada até o
+        fim da mensagem. Custo O(len(patch) + log(total_len)).
+        Também vale para o FCS, que difere do CRC por uma constante.
+        Args:
+            old_crc: CRC-32 (ou FCS) da mensagem original
+            total_len: tamanho da mensagem em bytes
+            offset: posição do primeiro byte alterado
+            old_bytes: bytes originais nessa posição
+            new_bytes: bytes novos (mesmo tamanho)
+        Returns:
+            int: CRC-32 (ou FCS) da mensagem alterada
+        """
+        return self.patch_many(old_crc, total_len,
+                               [(offset, old_bytes, new_bytes)])
+    
+    def patch_many(self, old_crc, total_len, patches, buffer=None):
+        """
+        Aplica vários patches ordenados e sem sobreposição a uma mensagem,
+        avançando um único registrador de diferença: os intervalos entre
+        patches são atravessados com extend_zeros.
+        Args:
+            old_crc: CRC-32 (ou FCS) da mensagem original
+            total_len: tamanho da mensagem em bytes
+            patches: sequência de (offset, old_bytes, new_bytes) em ordem
+                crescente de offset
+            buffer: buffer gravável com a mensagem; se informado, os bytes
+                novos são escritos nele e old_bytes pode ser None (lido do
+                próprio buffer)
+        Returns:
+            int: CRC-32 (ou FCS) da mensagem alterada
+        """
+        # Valida todos os patches antes de alterar o buffer, para que um
+        # patch inválido não deixe a mensagem parcialmente reescrita
+        checked = []
+        position = 0
+        for offset, old_bytes, new_bytes in patches:
+            size = len(new_bytes)
+            if offset < position or offset + size > total_len:
+                raise ValueError("Patches devem estar ordenados, sem "
+                                 "sobreposição e dentro da mensagem")
+            if old_bytes is None:
+                if buffer is None:
+                    raise ValueError("old_bytes só pode ser None com buffer")
+                old_bytes = bytes(buffer[offset:offset + size])
+            if len(old_bytes) != size:
+                raise ValueError("old_bytes e new_bytes devem ter o mesmo tamanho")
+            checked.append((offset, old_bytes, new_bytes))
+            position = offset + size
+        register = 0
+        position = 0
+        for offset, old_bytes, new_bytes in checked:
+            size = len(new_bytes)
+            if buffer is not None:
+                buffer[offset:offset + size] = new_bytes
+            delta = (int.from_bytes(old_bytes, 'big')
+                     ^ int.from_bytes(new_bytes, 'big')).to_bytes(size, 'big')
+            register = self.extend_zeros(register, offset - position)
+            register = self.update_register(register, delta, "zlib")
+            position = offset + size
+        return old_crc ^ self.extend_zeros(register, total_len - position)
+    
+    def extend_zeros(self, crc_state, n):
+        """
+        Avança o registrador CRC por n bytes nulos em O(log n), sem
+        processá-los: equivale a update_register(crc_state, bytes(n)).
+        Args:
+            crc_state: valor atual do registrador (sem XOR final)
+            n: quantidade de bytes 0x00
+        Returns:
+            int: Novo valor do registrador
+        """
+        if n <= 0:
+            return crc_state
+        if n <= ZERO_BLOCK_SIZE:
+            # Sequências curtas: o zlib percorre os zeros mais rápido que a
+            # multiplicação em GF(2) (zeros espelhados continuam zeros)
+            register = crc_state if self.reflected else reflect32(crc_state)
+            register = zlib.crc32(_ZERO_VIEW[:n], register ^ 0xFFFFFFFF) ^ 0xFFFFFFFF
+            return register if self.reflected else reflect32(register)
+        return self._shift_register(crc_state, n)
+    
+    def _update_zero_runs(self, crc, data, engine):
+        """
+        Avança o registrador como update_register, mas detecta blocos
+        alinhados de ZERO_BLOCK_SIZE bytes nulos; sequências de pelo menos
+        ZERO_RUN_MIN bytes são puladas com extend_zeros.
+        """
+        view = memoryview(data).cast('B')
+        size = len(view)
+        if size < ZERO_RUN_MIN:
+            return self.update_register(crc, view, engine)
+        block = ZERO_BLOCK_SIZE
+        # Último byte de cada bloco completo: só os blocos cuja amostra é
+        # nula (em sequência suficiente) são comparados com o bloco zero
+        samples = view[block - 1::block].tobytes()
+        marker = bytes(ZERO_RUN_MIN // block)
+        done = 0  # início do trecho ainda não processado
+        candidate = samples.find(marker)
+        while candidate >= 0:
+            start = end = candidate * block
+            while (end + block <= size and not samples[end // block]
+                   and view[end:end + block].tobytes() == _ZERO_BLOCK):
+                end += block
+            if end - start >= ZERO_RUN_MIN:
+                if done < start:
+                    crc = self.update_register(crc, view[done:start], engine)
+                crc = self.extend_zeros(crc, end - start)
+                done = end
+                candidate = samples.find(marker, end // block)
+            else:
+                # O bloco em `end` não é nulo: a busca recomeça depois dele
+                candidate = samples.find(marker, end // block + 1)
+        if done < size:
+            crc = self.update_register(crc, view[done:], engine)
+        return crc
+    
+    def _shift_register(self, crc, count):
+        """
+        Avança o registrador por `count` bytes nulos em O(log count),
+        multiplicando-o por x^(8*count) mod P.
+        """
+        if self.reflected:
+            # O CRC refletido é o espelho do CRC MSB-first dos bytes espelhados
+            return reflect32(multmodp(x8nmodp(count, self.POLYNOMIAL),
+                                      reflect32(crc), self.POLYNOMIAL))
+        return multmodp(x8nmodp(count, self.POLYNOMIAL), crc, self.POLYNOMIAL)
+    
     def calculate_fcs(self, data):
         """
         Calcula o FCS (Frame Check Sequence) = complemento de 1 do CRC.
         Em Ethernet, o FCS é enviado como complemento de 1 do CRC.
+        No modo refletido o CRC final já é o resto complementado que o
+        IEEE 802.3 transmite, portanto FCS = CRC.
         Args:
             data: bytes a serem processados
         Returns:
             tuple: (CRC calculado, FCS = complemento de 1)
         """
         crc = self.calculate_crc(data)
+        if self.reflected:
+            return crc, crc
         fcs = crc ^ 0xFFFFFFFF  # Complemento de 1
         return crc, fcs
     
+    def fcs_to_bytes(self, fcs):
+        """
+        Converte o FCS para os 4 bytes na ordem do fio
+        (little-endian no modo refletido, big-endian no modo MSB-first).
+        """
+        return fcs.to_bytes(4, 'little' if self.reflected else 'big')
+    
+    def fcs_from_bytes(self, raw):
+        """Converte os 4 bytes de FCS capturados em um inteiro."""
+        if len(raw) != 4:
+            raise ValueError("O FCS deve ter exatamente 4 bytes")
+        return int.from_bytes(raw, 'little' if self.reflected else 'big')
+    
+    def _received_fcs(self, value):
+        """
+        Normaliza um FCS recebido: buffers de 4 bytes são convertidos na
+        ordem do fio; qualquer inteiro (int, numpy.uint32, ...) vira int.
+        """
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return self.fcs_from_bytes(value)
+        return operator.index(value)
+    
     def validate_frame(self, data, received_fcs):
         """
         Valida a integridade de um quadro recebido.
         Args:
             data: dados recebidos
-            received_fcs: valor do FCS recebido
+            received_fcs: valor do FCS recebido (inteiro) ou os 4 bytes
+                finais do quadro exatamente como capturados
         Returns:
             tuple: (is_valid, calculated_crc, calculated_fcs)
         """
+        received_fcs = self._received_fcs(received_fcs)
         calculated_crc, calculated_fcs = self.calculate_fcs(data)
         is_valid = calculated_fcs == received_fcs
         return is_valid, calculated_crc, calculated_fcs
+    
+    def _syndrome(self, data, received_fcs):
+        """
+        Calcula a síndrome (CRC calculado XOR CRC esperado) na convenção
+        MSB-first. Returns: (síndrome, FCS recebido como inteiro)
+        """
+        received_fcs = self._received_fcs(received_fcs)
+        expected_crc = received_fcs if self.reflected else received_fcs ^ 0xFFFFFFFF
+        syndrome = self.calculate_crc(data, engine="zlib") ^ expected_crc
+        return (reflect32(syndrome) if self.reflected else syndrome), received_fcs
+    
+    def bursts_from_fcs(self, length, received_fcs, calculated_fcs, max_burst=32):
+        """
+        Lista as rajadas de até max_burst bits compatíveis com a diferença
+        entre o FCS recebido e o calculado de um quadro de `length` bytes
+        (sem o FCS), sem reprocessar os dados.
+        Uma rajada b(x) de grau < 32 começando no grau D produz a síndrome
+        S = b(x)·x^D mod P, logo b(x) = S·x^-D mod P. Percorrendo D a partir
+        de 0 e multiplicando por x^-1 a cada passo, todas as posições são
+        testadas em O(n).
+        Args:
+            length: tamanho dos dados em bytes
+            received_fcs: FCS recebido (inteiro)
+            calculated_fcs: FCS calculado sobre os dados recebidos
+            max_burst: comprimento máximo da rajada (1 a 32 bits)
+        Returns:
+            list: Burst candidatas, das mais curtas (mais prováveis) para as
+            mais longas; vazia se os FCS coincidem
+        """
+        if not 1 <= max_burst <= 32:
+            raise ValueError("max_burst deve estar entre 1 e 32")
+        syndrome = received_fcs ^ calculated_fcs
+        if self.reflected:
+            syndrome = reflect32(syndrome)
+        total_bits = 8 * (length + 4)
+        polynomial = self.POLYNOMIAL
+        bursts = []
+        value = syndrome
+        for degree in range(total_bits if syndrome else 0):
+            if value & 1:
+                size = value.bit_length()
+                if size <= max_burst and degree + size <= total_bits:
+                    bursts.append(Burst(total_bits - degree - size, size, value))
+                value = ((value ^ polynomial) >> 1) | 0x80000000
+            else:
+                value >>= 1
+        bursts.sort(key=lambda burst: (burst.length, burst.start))
+        return bursts
+    
+    def locate_bursts(self, data, received_fcs, max_burst=32):
+        """
+        Localiza as rajadas de erro compatíveis com a síndrome de um quadro.
+        Args:
+            data: dados recebidos
+            received_fcs: FCS recebido (inteiro ou 4 bytes capturados)
+            max_burst: comprimento máximo da rajada (1 a 32 bits)
+        Returns:
+            list: Burst candidatas (ver bursts_from_fcs)
+        """
+        received_fcs = self._received_fcs(received_fcs)
+        _, calculated_fcs = self.calculate_fcs(data)
+        return self.bursts_from_fcs(len(data), received_fcs, calculated_fcs,
+                                    max_burst)
+    
+    def syndrome_index(self, max_length=CORRECTION_MAX_LENGTH):
+        """
+        Retorna o índice síndrome -> grau para quadros de até max_length
+        bytes (gerado uma vez por classe de tamanho e compartilhado).
+        """
+        length = _length_class(max_length + 4)
+        return TABLE_REGISTRY.get(
+            ("syndromes", self.POLYNOMIAL, length),
+            lambda: _generate_syndromes(self.POLYNOMIAL, 8 * length))
+    
+    def _flip_bits(self, data, received_fcs, positions):
+        """
+        Inverte os bits indicados (posições na ordem de transmissão) e
+        retorna (dados corrigidos, FCS corrigido).
+        """
+        size = len(data)
+        corrected = bytearray(data)
+        wire_fcs = bytearray(self.fcs_to_bytes(received_fcs))
+        for position in positions:
+            byte, bit = divmod(position, 8)
+            # No modo refletido cada byte é transmitido LSB primeiro
+            mask = 1 << bit if self.reflected else 0x80 >> bit
+            if byte < size:
+                corrected[byte] ^= mask
+            else:
+                wire_fcs[byte - size] ^= mask
+        return bytes(corrected), self.fcs_from_bytes(wire_fcs)
+    
+    def correct_single_bit(self, data, received_fcs,
+                           max_length=CORRECTION_MAX_LENGTH):
+        """
+        Localiza e corrige um único bit invertido em O(1) por quadro,
+        consultando o índice de síndromes.
+        Args:
+            data: dados recebidos
+            received_fcs: FCS recebido (inteiro ou 4 bytes capturados)
+            max_length: tamanho máximo de quadro atendido pelo índice
+        Returns:
+            Correction: status, dados e FCS corrigidos, posição do bit e
+            se a correção é confiável
+        """
+        syndrome, received_fcs = self._syndrome(data, received_fcs)
+        if syndrome == 0:
+            return Correction("valid", bytes(data), received_fcs, (), True)
+        total_bits = 8 * (len(data) + 4)
+        if len(data) > max_length:
+            return Correction("uncorrectable", None, None, (), False)
+        degree = self.syndrome_index(max_length).get(syndrome)
+        if degree is None or degree >= total_bits:
+            return Correction("uncorrectable", None, None, (), False)
+        position = total_bits - 1 - degree
+        corrected, fcs = self._flip_bits(data, received_fcs, (position,))
+        confident = 8 * len(data) <= HD4_MAX_DATA_BITS
+        return Correction("corrected", corrected, fcs, (position,), confident)
+    
+    def correct_double_bit(self, data, received_fcs,
+                           max_length=CORRECTION_MAX_LENGTH):
+        """
+        Corrige até dois bits invertidos procurando os graus i < j com
+        síndrome(i) XOR síndrome(j) igual à síndrome observada. Para cada i
+        basta consultar síndrome XOR x^i no índice, então o custo é O(n)
+        por quadro em vez de O(n²) tentativas com calculate_crc.
+        Args:
+            data: dados recebidos
+            received_fcs: FCS recebido (inteiro ou 4 bytes capturados)
+            max_length: tamanho máximo de quadro atendido pelo índice
+        Returns:
+            Correction: "ambiguous" (com os pares candidatos em positions)
+            quando mais de um par explica a síndrome
+        """
+        result = self.correct_single_bit(data, received_fcs, max_length)
+        if result.status != "uncorrectable" or len(data) > max_length:
+            return result
+        syndrome, received_fcs = self._syndrome(data, received_fcs)
+        total_bits = 8 * (len(data) + 4)
+        index = self.syndrome_index(max_length)
+        pairs = []
+        # O índice preserva a ordem de inserção: as chaves são x^0, x^1, ...
+        for degree, value in zip(range(total_bits), index):
+            other = index.get(syndrome ^ value)
+            if other is not None and degree < other < total_bits:
+                pairs.append((total_bits - 1 - other, total_bits - 1 - degree))
+        if not pairs:
+            return Correction("uncorrectable", None, None, (), False)
+        if len(pairs) > 1:
+            return Correction("ambiguous", None, None, tuple(pairs), False)
+        corrected, fcs = self._flip_bits(data, received_fcs, pairs[0])
+        confident = 8 * len(data) <= HD5_MAX_DATA_BITS
+        return Correction("corrected", corrected, fcs, pairs[0], confident)
+    
+    def _numpy_table(self):
+        """Retorna a tabela de lookup como array NumPy uint32."""
+        _require_numpy()
+        return TABLE_REGISTRY.get(
+            ("numpy", self.POLYNOMIAL, self.reflected),
+            lambda: np.array(self.crc_table, dtype=np.uint32))
+    
+    def _crc_lockstep(self, frames, lengths):
+        """
+        Calcula o CRC-32 de vários quadros em paralelo com NumPy.
+        Os quadros são ordenados por tamanho (decrescente) e copiados para
+        uma matriz preenchida com zeros (uma linha por quadro); a recorrência
+        da tabela é aplicada a uma coluna (posição de byte) por vez, apenas
+        nas linhas cujo quadro ainda não terminou.
+        Args:
+            frames: sequência de buffers
+            lengths: array NumPy com o tamanho de cada quadro
+        Returns:
+            numpy.ndarray: CRCs (uint32) na ordem original
+        """
+        count = len(frames)
+        if count == 0:
+            return np.zeros(0, dtype=np.uint32)
+        order = np.argsort(-lengths, kind="stable")
+        sorted_lengths = lengths[order]
+        width = int(sorted_lengths[0])
+        rows = np.zeros((count, width), dtype=np.uint8)
+        for row, index in enumerate(order):
+            size = int(sorted_lengths[row])
+            if size:
+                rows[row, :size] = np.frombuffer(frames[index], dtype=np.uint8,
+                                                 count=size)
+        columns = rows.T
+        # active[j] = quantidade de quadros com mais de j bytes
+        active = np.searchsorted(-sorted_lengths, -np.arange(width), side="left")
+        table = self._numpy_table()
+        crc = np.full(count, self.INITIAL_VALUE, dtype=np.uint32)
+        # Buffers reaproveitados para evitar alocações por coluna
+        index_buffer = np.empty(count, dtype=np.uint32)
+        lookup_buffer = np.empty(count, dtype=np.uint32)
+        for j in range(width):
+            k = active[j]
+            current = crc[:k]
+            index = index_buffer[:k]
+            lookup = lookup_buffer[:k]
+            if self.reflected:
+                np.bitwise_xor(current, columns[j, :k], out=index)
+                np.bitwise_and(index, 0xFF, out=index)
+                table.take(index, out=lookup)
+                np.right_shift(current, 8, out=current)
+            else:
+                np.right_shift(current, 24, out=index)
+                np.bitwise_xor(index, columns[j, :k], out=index)
+                table.take(index, out=lookup)
+                np.left_shift(current, 8, out=current)
+            np.bitwise_xor(current, lookup, out=current)
+        result = np.empty_like(crc)
+        result[order] = crc ^ self.FINAL_XOR
+        return result
+    
+    def _crc_lockstep_equal(self, matrix):
+        """
+        Calcula o CRC-32 de todas as linhas de uma matriz uint8 em que
+        todos os quadros têm o mesmo tamanho (sem máscara nem preenchimento).
+        Args:
+            matrix: numpy.ndarray (quadros x bytes) de uint8
+        Returns:
+            numpy.ndarray: CRCs (uint32), um por linha
+        """
+        crc = np.full(len(matrix), self.INITIAL_VALUE, dtype=np.uint32)
+        return self._lockstep_rows(matrix, crc) ^ np.uint32(self.FINAL_XOR)
+    
+    def _lockstep_rows(self, matrix, crc):
+        """
+        Avança um registrador por linha da matriz uint8, coluna a coluna.
+        Args:
+            matrix: numpy.ndarray (linhas x bytes) de uint8
+            crc: registradores iniciais (uint32), alterados no lugar
+        Returns:
+            numpy.ndarray: registradores finais (sem XOR final)
+        """
+        count = len(crc)
+        table = self._numpy_table()
+        index = np.empty(count, dtype=np.uint32)
+        lookup = np.empty(count, dtype=np.uint32)
+        for column in matrix.T:
+            if self.reflected:
+                np.bitwise_xor(crc, column, out=index)
+                np.bitwise_and(index, 0xFF, out=index)
+                table.take(index, out=lookup)
+                np.right_shift(crc, 8, out=crc)
+            else:
+                np.right_shift(crc, 24, out=index)
+                np.bitwise_xor(index, column, out=index)
+                table.take(index, out=lookup)
+                np.left_shift(crc, 8, out=crc)
+            np.bitwise_xor(crc, lookup, out=crc)
+        return crc
+    
+    def _update_lanes(self, crc, data, lanes=None):
+        """
+        Avança o registrador dividindo um buffer grande em K faixas
+        contíguas processadas juntas com NumPy (requer NumPy).
+        Cada faixa é calculada a partir do registrador zero (parte linear
+        do CRC) e as faixas são unidas em árvore, multiplicando a metade
+        esquerda por x^(8*tamanho) mod P de forma vetorizada.
+        Args:
+            crc: valor atual do registrador
+            data: bytes a serem processados
+            lanes: quantidade de faixas (padrão: escolhida pelo tamanho;
+                buffers menores que LANES_MIN_SIZE usam slicing-by-16)
+        Returns:
+            int: Novo valor do registrador
+        """
+        _require_numpy()
+        view = memoryview(data).cast('B')
+        size = len(view)
+        if lanes is None:
+            if size < LANES_MIN_SIZE:
+                return self._update_slice16(crc, view)
+            lanes = min(LANES_MAX, size // LANES_MIN_LENGTH)
+        if lanes < 2:
+            return self._update_slice16(crc, view)
+        lane_length = size // lanes
+        body = lanes * lane_length
+        matrix = np.frombuffer(view, dtype=np.uint8, count=body)
+        registers = self._lockstep_rows(matrix.reshape(lanes, lane_length),
+                                        np.zeros(lanes, dtype=np.uint32))
+        crc = self._shift_register(crc, body) ^ self._fold_lanes(registers,
+                                                                 lane_length)
+        return self._update_slice16(crc, view[body:])
+    
+    def _fold_lanes(self, registers, lane_length):
+        """
+        Une registradores lineares (valor inicial zero) de faixas
+        consecutivas de mesmo tamanho em um único registrador.
+        """
+        if self.reflected:
+            registers = _reflect32_array(registers)
+        length = lane_length
+        while len(registers) > 1:
+            if len(registers) % 2:
+                # Uma faixa de zeros à esquerda não altera a parte linear
+                registers = np.concatenate(
+                    (np.zeros(1, dtype=np.uint32), registers))
+            shift = x8nmodp(length, self.POLYNOMIAL)
+            registers = (_multmodp_array(registers[0::2], shift, self.POLYNOMIAL)
+                         ^ registers[1::2])
+            length *= 2
+        result = int(registers[0])
+        return reflect32(result) if self.reflected else result
+    
+    def calculate_crc_batch(self, frames, min_bucket=16):
+        """
+        Calcula o CRC-32 de muitos quadros de uma vez (requer NumPy).
+        Quadros com o mesmo tamanho são agrupados em matrizes uint8 e
+        processados coluna a coluna, de modo que o laço em Python custa
+        O(tamanho do quadro) por grupo, e não O(total de bytes). Tamanhos
+        com menos de min_bucket quadros são processados juntos em uma
+        matriz preenchida com zeros.
+        Args:
+            frames: sequência de buffers
+            min_bucket: quantidade mínima de quadros para formar um grupo
+        Returns:
+            numpy.ndarray: CRCs (uint32) na ordem original
+        """
+        _require_numpy()
+        count = len(frames)
+        lengths = np.fromiter((len(frame) for frame in frames),
+                              dtype=np.int64, count=count)
+        result = np.empty(count, dtype=np.uint32)
+        if count == 0:
+            return result
+        sizes, inverse, counts = np.unique(lengths, return_inverse=True,
+                                           return_counts=True)
+        leftovers = []
+        for bucket, (size, members) in enumerate(zip(sizes.tolist(),
+                                                     counts.tolist())):
+            indices = np.flatnonzero(inverse == bucket)
+            if members < min_bucket:
+                leftovers.append(indices)
+                continue
+            if size == 0:
+                result[indices] = self.INITIAL_VALUE ^ self.FINAL_XOR
+                continue
+            joined = b"".join([frames[i] for i in indices.tolist()])
+            matrix = np.frombuffer(joined, dtype=np.uint8).reshape(members, size)
+            result[indices] = self._crc_lockstep_equal(matrix)
+        if leftovers:
+            indices = np.concatenate(leftovers)
+            result[indices] = self._crc_lockstep(
+                [frames[i] for i in indices.tolist()], lengths[indices])
+        return result
+    
+    def validate_frames(self, frames, received_fcs, offsets=None, engine=None):
+        """
+        Valida um lote de quadros de uma vez (requer NumPy).
+        Args:
+            frames: sequência de buffers, ou um único buffer contíguo
+                quando offsets é informado
+            received_fcs: FCS recebidos (inteiros ou buffers de 4 bytes)
+            offsets: limites dos quadros no buffer (n + 1 posições)
+            engine: "lockstep" processa todos os quadros em paralelo com
+                NumPy (ver calculate_crc_batch); qualquer engine de
+                ENGINES processa um quadro por
+                vez. Padrão: "lockstep", ou "zlib" no modo refletido (onde
+                o zlib não precisa espelhar bytes e é mais rápido)
+        Returns:
+            tuple: arrays NumPy (is_valid, calculated_crc, calculated_fcs)
+        """
+        _require_numpy()
+        if offsets is not None:
+            buffer = memoryview(frames).cast('B')
+            offsets = np.asarray(offsets, dtype=np.int64)
+            frames = [buffer[start:end]
+                      for start, end in zip(offsets[:-1].tolist(),
+                                            offsets[1:].tolist())]
+            lengths = np.diff(offsets)
+        else:
+            lengths = np.fromiter((len(frame) for frame in frames),
+                                  dtype=np.int64, count=len(frames))
+        if len(received_fcs) != len(frames):
+            raise ValueError("Quantidade de FCS diferente da de quadros")
+        if len(received_fcs) and not isinstance(received_fcs[0], (int, np.integer)):
+            received_fcs = [self.fcs_from_bytes(raw) for raw in received_fcs]
+        received = np.asarray(received_fcs, dtype=np.uint32)
+        if engine is None:
+            engine = "zlib" if self.reflected else "lockstep"
+        if engine == "lockstep":
+            calculated_crc = self.calculate_crc_batch(frames)
+        else:
+            calculated_crc = np.fromiter(
+                (self.calculate_crc(frame, engine=engine) for frame in frames),
+                dtype=np.uint32, count=len(frames))
+        if self.reflected:
+            calculated_fcs = calculated_crc.copy()
+        else:
+            calculated_fcs = calculated_crc ^ np.uint32(0xFFFFFFFF)
+        is_valid = calculated_fcs == received
+        return is_valid, calculated_crc, calculated_fcs
+
+
+class CRC32:
+    """
+    Objeto de CRC-32 incremental no estilo hashlib.
+    Permite processar os dados em pedaços (update) com memória constante
+    e exportar/importar o registrador bruto de 32 bits para continuar o
+    cálculo em outra etapa do pipeline.
+    """
+    name = "crc32"
+    digest_size = 4
+    
+    def __init__(self, data=b"", engine="zlib", calculator=None):
+        """
+        Args:
+            data: bytes iniciais (opcional)
+            engine: engine usado em update (ver CRC32Calculator.ENGINES)
+            calculator: instância de CRC32Calculator a reutilizar
+        """
+        if calculator is None:
+            calculator = CRC32Calculator()
+        if engine not in calculator.ENGINES:
+            raise ValueError(f"Engine desconhecido: {engine!r}")
+        self._calculator = calculator
+        self.engine = engine
+        self.register = calculator.INITIAL_VALUE
+        if data:
+            self.update(data)
+    
+    @classmethod
+    def from_register(cls, register, engine="zlib", calculator=None):
+        """
+        Cria um objeto a partir de um registrador exportado.
+        Args:
+            register: valor bruto do registrador (sem XOR final)
+        Returns:
+            CRC32: objeto pronto para continuar o cálculo
+        """
+        crc = cls(engine=engine, calculator=calculator)
+        crc.register = register & 0xFFFFFFFF
+        return crc
+    
+    def export_register(self):
+        """Retorna o valor bruto do registrador (sem XOR final)."""
+        return self.register
+    
+    def update(self, data):
+        """Processa mais um pedaço de dados."""
+        self.register = self._calculator._update_zero_runs(
+            self.register, data, self.engine)
+    
+    @property
+    def crcvalue(self):
+        """Valor do CRC-32 dos dados processados até agora."""
+        return self.register ^ self._calculator.FINAL_XOR
+    
+    def digest(self):
+        """Retorna o CRC-32 como 4 bytes big-endian."""
+        return self.crcvalue.to_bytes(4, 'big')
+    
+    def hexdigest(self):
+        """Retorna o CRC-32 como string hexadecimal."""
+        return self.digest().hex()
+    
+    def copy(self):
+        """Retorna uma cópia independente do estado atual."""
+        clone = self.__class__.__new__(self.__class__)
+        clone._calculator = self._calculator
+        clone.engine = self.engine
+        clone.register = self.register
+        return clone
+
+
+# Parâmetros do modelo Rocksoft para um CRC genérico
+CRCSpec = namedtuple(
+    "CRCSpec", "width poly init refin refout xorout check name",
+    defaults=(None, None))
+
+
+def reflect_bits(value, width):
+    """Inverte a ordem dos `width` bits menos significativos de value."""
+    result = 0
+    for _ in range(width):
+        result = (result << 1) | (value & 1)
+        value >>= 1
+    return result
+
+
+# Catálogo de especificações padrão (valores de check para b"123456789")
+CRC_PRESETS = {spec.name: spec for spec in (
+    CRCSpec(8, 0x07, 0x00, False, False, 0x00, 0xF4, "CRC-8/SMBUS"),
+    CRCSpec(16, 0x1021, 0xFFFF, False, False, 0x0000, 0x29B1,
+            "CRC-16/IBM-3740"),
+    CRCSpec(16, 0x1021, 0x0000, True, True, 0x0000, 0x2189,
+            "CRC-16/KERMIT"),
+    CRCSpec(16, 0x1021, 0x0000, False, False, 0x0000, 0x31C3,
+            "CRC-16/XMODEM"),
+    CRCSpec(32, 0x04C11DB7, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0xCBF43926,
+            "CRC-32/ISO-HDLC"),
+    CRCSpec(32, 0x04C11DB7, 0xFFFFFFFF, False, False, 0xFFFFFFFF, 0xFC891918,
+            "CRC-32/BZIP2"),
+    CRCSpec(32, 0x04C11DB7, 0xFFFFFFFF, False, False, 0x00000000, 0x0376E6E7,
+            "CRC-32/MPEG-2"),
+    CRCSpec(32, 0x1EDC6F41, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0xE3069283,
+            "CRC-32/ISCSI"),
+    CRCSpec(64, 0x42F0E1EBA9EA3693, 0x0000000000000000, False, False,
+            0x0000000000000000, 0x6C40DF5F0B497347, "CRC-64/ECMA-182"),
+    CRCSpec(64, 0x42F0E1EBA9EA3693, 0xFFFFFFFFFFFFFFFF, True, True,
+            0xFFFFFFFFFFFFFFFF, 0x995DC9BBDF1939FA, "CRC-64/XZ"),
+)}
+# Nomes alternativos usados com frequência
+CRC_PRESETS["CRC-32"] = CRC_PRESETS["CRC-32/ISO-HDLC"]
+CRC_PRESETS["CRC-32C"] = CRC_PRESETS["CRC-32/ISCSI"]
+CRC_PRESETS["CRC-16/CCITT"] = CRC_PRESETS["CRC-16/KERMIT"]
+CRC_PRESETS["CRC-16/CCITT-FALSE"] = CRC_PRESETS["CRC-16/IBM-3740"]
+
+
+class CRCCalculator:
+    """
+    Calculador de CRC genérico parametrizado pelo modelo Rocksoft
+    (largura, polinômio, valor inicial, reflexão de entrada/saída e XOR
+    final). As tabelas ficam no TABLE_REGISTRY, de modo que criar
+    instâncias não gera tabelas novas.
+    """
+    ENGINES = ("direct", "table")
+    __slots__ = ("spec", "mask", "crc_table")
+    
+    def __init__(self, spec):
+        """
+        Args:
+            spec: CRCSpec ou nome de uma especificação de CRC_PRESETS
+        """
+        if isinstance(spec, str):
+            try:
+                spec = CRC_PRESETS[spec]
+            except KeyError:
+                raise ValueError(f"CRC desconhecido: {spec!r}") from None
+        if spec.width < 8:
+            raise ValueError("Largura mínima suportada: 8 bits")
+        self.spec = spec
+        self.mask = (1 << spec.width) - 1
+        self.crc_table = TABLE_REGISTRY.get(
+            ("crc", spec.width, spec.poly, spec.refin), self._generate_crc_table)
+    
+    def _generate_crc_table(self):
+        """Gera tabela de lookup para a especificação."""
+        width, mask = self.spec.width, self.mask
+        table = []
+        if self.spec.refin:
+            poly = reflect_bits(self.spec.poly, width)
+            for i in range(256):
+                crc = i
+                for _ in range(8):
+                    crc = (crc >> 1) ^ poly if crc & 1 else crc >> 1
+                table.append(crc)
+        else:
+            top = 1 << (width - 1)
+            for i in range(256):
+                crc = i << (width - 8)
+                for _ in range(8):
+                    if crc & top:
+                        crc = ((crc << 1) ^ self.spec.poly) & mask
+                    else:
+                        crc = (crc << 1) & mask
+                table.append(crc)
+        return tuple(table)
+    
+    @property
+    def initial_register(self):
+        """Valor inicial do registrador (já refletido se refin)."""
+        if self.spec.refin:
+            return reflect_bits(self.spec.init, self.spec.width)
+        return self.spec.init
+    
+    def finalize(self, crc):
+        """Aplica a reflexão de saída e o XOR final ao registrador."""
+        if self.spec.refin != self.spec.refout:
+            crc = reflect_bits(crc, self.spec.width)
+        return crc ^ self.spec.xorout
+    
+    def _update_table(self, crc, data):
+        """Avança o registrador byte a byte usando a tabela de lookup."""
+        table = self.crc_table
+        if self.spec.refin:
+            for byte in data:
+                crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+            return crc
+        shift, mask = self.spec.width - 8, self.mask
+        for byte in data:
+            crc = ((crc << 8) & mask) ^ table[((crc >> shift) ^ byte) & 0xFF]
+        return crc
+    
+    def _update_direct(self, crc, data):
+        """Avança o registrador bit a bit (sem tabela)."""
+        width, mask = self.spec.width, self.mask
+        if self.spec.refin:
+            poly = reflect_bits(self.spec.poly, width)
+            for byte in data:
+                crc ^= byte
+                for _ in range(8):
+                    crc = (crc >> 1) ^ poly if crc & 1 else crc >> 1
+            return crc
+        top = 1 << (width - 1)
+        for byte in data:
+            crc ^= byte << (width - 8)
+            for _ in range(8):
+                if crc & top:
+                    crc = ((crc << 1) ^ self.spec.poly) & mask
+                else:
+                    crc = (crc << 1) & mask
+        return crc
+    
+    def update_register(self, crc, data, engine="table"):
+        """
+        Avança o registrador CRC sobre os dados com o engine escolhido.
+        Returns:
+            int: Novo valor do registrador
+        """
+        if engine == "table":
+            return self._update_table(crc, data)
+        if engine == "direct":
+            return self._update_direct(crc, data)
+        raise ValueError(f"Engine desconhecido: {engine!r}")
+    
+    def calculate_crc(self, data, engine="table"):
+        """
+        Calcula o CRC dos dados fornecidos.
+        Args:
+            data: bytes a serem processados
+            engine: "table" ou "direct"
+        Returns:
+            int: Valor do CRC calculado
+        """
+        return self.finalize(
+            self.update_register(self.initial_register, data, engine))
+    
+    def self_test(self):
+        """Confere o CRC de b"123456789" com o valor de check da spec."""
+        return self.spec.check is None or \
+            self.calculate_crc(b"123456789") == self.spec.check
+
+
+def _crc_file_range(path, offset, length, engine, reflected=False):
+    """
+    Calcula o CRC-32 de um intervalo de um arquivo.
+    Executado nos processos de trabalho: cada um abre o arquivo por conta
+    própria, de modo que nenhum dado precisa ser serializado.
+    """
+    calculator = CRC32Calculator(reflected)
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        register = calculator._update_stream(
+            calculator.INITIAL_VALUE, f, engine, limit=length)
+    return register ^ calculator.FINAL_XOR
+
+
+def crc_file_parallel(path, workers=None, chunk_size=64 << 20, engine="zlib",
+                      reflected=False):
+    """
+    Calcula o CRC-32 de um arquivo grande usando vários processos.
+    O arquivo é dividido em intervalos, cada processo calcula o CRC do seu
+    intervalo e os resultados são unidos com CRC32Calculator.combine.
+    Args:
+        path: caminho do arquivo
+        workers: número de processos (padrão: os.cpu_count())
+        chunk_size: tamanho de cada intervalo em bytes
+        engine: engine usado em cada intervalo
+        reflected: Se True, calcula o CRC refletido do IEEE 802.3
+    Returns:
+        int: CRC-32 do arquivo inteiro
+    """
+    calculator = CRC32Calculator(reflected)
+    status = os.stat(path)
+    if not stat.S_ISREG(status.st_mode):
+        # Pipes e dispositivos não têm tamanho nem permitem leitura por
+        # intervalos: são lidos em sequência
+        return calculator.crc_file(path, engine=engine)
+    size = status.st_size
+    if size == 0:
+        return calculator.calculate_crc(b"")
+    offsets = range(0, size, chunk_size)
+    lengths = [min(chunk_size, size - offset) for offset in offsets]
+    if workers == 1 or len(lengths) == 1:
+        crcs = map(_crc_file_range, repeat(path), offsets, lengths,
+                   repeat(engine), repeat(reflected))
+        return _combine_ranges(calculator, crcs, lengths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        crcs = executor.map(_crc_file_range, repeat(path), offsets, lengths,
+                            repeat(engine), repeat(reflected))
+        return _combine_ranges(calculator, crcs, lengths)
+
+
+def _combine_ranges(calculator, crcs, lengths):
+    """Une os CRCs de intervalos consecutivos na ordem do arquivo."""
+    result = None
+    for crc, length in zip(crcs, lengths):
+        result = crc if result is None else calculator.combine(result, crc, length)
+    return result
 
 
 def input_data_source():
@@ -251,5 +1821,243 @@ def menu_principal():
             print("✗ Opção inválida! Tente novamente.")
 
 
+class ResultWriter:
+    """
+    Escreve resultados da linha de comando em streaming, uma linha por
+    registro, nos formatos text, csv ou json (JSON Lines).
+    """
+    
+    def __init__(self, fields, output_format="text", stream=None):
+        self.fields = fields
+        self.format = output_format
+        self.stream = stream if stream is not None else sys.stdout
+        self._csv = None
+        if output_format == "csv":
+            self._csv = csv.writer(self.stream)
+            self._csv.writerow(fields)
+    
+    def write(self, row):
+        """Escreve um registro (dict com as chaves de fields)."""
+        if self.format == "json":
+            self.stream.write(json.dumps(row) + "\n")
+        elif self._csv is not None:
+            self._csv.writerow([row.get(field, "") for field in self.fields])
+        else:
+            self.stream.write("  ".join(
+                str(row.get(field, "")) for field in self.fields) + "\n")
+    
+    def summary(self, counters):
+        """Escreve os contadores finais (em stderr nos formatos tabulares)."""
+        if self.format == "json":
+            self.stream.write(json.dumps({"summary": counters}) + "\n")
+        else:
+            text = ", ".join(f"{key}={value}" for key, value in counters.items())
+            print(f"Resumo: {text}", file=sys.stderr)
+
+
+def _crc_stream(calculator, engine, stream):
+    """
+    Calcula o CRC-32 de um arquivo binário (stdin, pipe, dispositivo) em
+    streaming. Retorna (crc, bytes efetivamente lidos).
+    """
+    crc = CRC32(engine=engine, calculator=calculator)
+    buffer = bytearray(READ_BLOCK_SIZE)
+    view = memoryview(buffer)
+    size = 0
+    while True:
+        count = stream.readinto(view)
+        if not count:
+            break
+        crc.update(view[:count])
+        size += count
+    return crc.crcvalue, size
+
+
+def command_crc(args):
+    """Subcomando crc: CRC-32 e FCS de arquivos, stdin ou dados hexadecimais."""
+    calculator = CRC32Calculator(args.reflected)
+    writer = ResultWriter(("source", "size", "crc", "fcs"), args.format)
+    sources = list(args.files)
+    if args.stdin:
+        sources.append("-")
+    if not sources and not args.hex:
+        sources.append("-")
+    if args.sparse and args.jobs > 1:
+        raise SystemExit("✗ Erro: --sparse não pode ser usado com --jobs")
+    for hex_data in args.hex:
+        try:
+            data = bytes.fromhex(hex_data)
+        except ValueError:
+            raise SystemExit(f"✗ Erro: Formato hexadecimal inválido: {hex_data!r}")
+        crc = calculator.calculate_crc(data, engine=args.engine)
+        fcs = crc if args.reflected else crc ^ 0xFFFFFFFF
+        writer.write(_crc_row("hex", len(data), crc, fcs))
+    for source in sources:
+        if source == "-":
+            crc, size = _crc_stream(calculator, args.engine, sys.stdin.buffer)
+        else:
+            try:
+                status = os.stat(source)
+                if not stat.S_ISREG(status.st_mode):
+                    # Pipes e dispositivos: o tamanho vem dos bytes lidos
+                    with open(source, 'rb') as f:
+                        crc, size = _crc_stream(calculator, args.engine, f)
+                elif args.jobs > 1:
+                    size = status.st_size
+                    crc = crc_file_parallel(source, workers=args.jobs,
+                                            engine=args.engine,
+                                            reflected=args.reflected)
+                else:
+                    size = status.st_size
+                    crc = calculator.crc_file(source, engine=args.engine,
+                                              sparse=args.sparse)
+            except OSError as error:
+                raise SystemExit(f"✗ Erro: Não foi possível ler {source!r}: "
+                                 f"{error.strerror or error}")
+        fcs = crc if args.reflected else crc ^ 0xFFFFFFFF
+        writer.write(_crc_row(source, size, crc, fcs))
+
+
+def _crc_row(source, size, crc, fcs):
+    return {"source": source, "size": size,
+            "crc": f"0x{crc:08X}", "fcs": f"0x{fcs:08X}"}
+
+
+def command_validate(args):
+    """Subcomando validate: valida capturas ou um quadro hexadecimal."""
+    if args.hex is not None:
+        if args.fcs is None:
+            raise SystemExit("✗ Erro: --hex requer --fcs")
+        # Quadros em hexadecimal usam o CRC MSB-first por padrão
+        reflected = bool(args.reflected)
+        calculator = CRC32Calculator(reflected)
+        try:
+            data = bytes.fromhex(args.hex)
+            received_fcs = int(args.fcs, 16)
+        except ValueError:
+            raise SystemExit("✗ Erro: Dados ou FCS em hexadecimal inválidos!")
+        crc = calculator.calculate_crc(data, engine=args.engine)
+        fcs = crc if reflected else crc ^ 0xFFFFFFFF
+        is_valid = fcs == received_fcs
+        writer = ResultWriter(("status", "size", "received_fcs", "calculated_fcs",
+                               "crc"), args.format)
+        writer.write({"status": "valid" if is_valid else "corrupted",
+                      "size": len(data), "received_fcs": f"0x{received_fcs:08X}",
+                      "calculated_fcs": f"0x{fcs:08X}", "crc": f"0x{crc:08X}"})
+        return 0 if is_valid else 1
+    if not args.pcap:
+        raise SystemExit("✗ Erro: informe --pcap ARQUIVO ou --hex DADOS --fcs FCS")
+    if args.all and args.jobs > 1:
+        raise SystemExit("✗ Erro: --all não pode ser usado com --jobs")
+    from pcap import validate_capture, validate_parallel
+
+    # Capturas usam o CRC refletido (FCS gravado pelas placas) por padrão
+    reflected = args.reflected is not False
+    writer = ResultWriter(("capture", "index", "status", "length",
+                           "received_fcs", "calculated_fcs"), args.format)
+    failures = 0
+    for capture in args.pcap:
+        summary = None
+        try:
+            if args.jobs > 1:
+                summary, verdicts = validate_parallel(
+                    capture, workers=args.jobs, reflected=reflected,
+                    fcs_len=args.fcs_len, engine=args.engine, verdicts=True)
+            else:
+                calculator = CRC32Calculator(reflected)
+                verdicts, summary = validate_capture(
+                    capture, calculator, fcs_len=args.fcs_len,
+                    engine=args.engine)
+            for verdict in verdicts:
+                if args.all or verdict.status in ("corrupted", "truncated"):
+                    writer.write(_verdict_row(capture, verdict))
+        except OSError as error:
+            raise SystemExit(f"✗ Erro: Não foi possível ler {capture!r}: "
+                             f"{error.strerror or error}")
+        except ValueError as error:
+            # Captura malformada ou cortada: emite o resumo parcial
+            if summary is not None:
+                counters = summary.as_dict()
+                counters["capture"] = capture
+                writer.summary(counters)
+            raise SystemExit(f"✗ Erro: Captura inválida {capture!r}: {error}")
+        counters = summary.as_dict()
+        counters["capture"] = capture
+        writer.summary(counters)
+        failures += summary.corrupted
+    return 1 if failures else 0
+
+
+def _verdict_row(capture, verdict):
+    row = {"capture": capture, "index": verdict.index, "status": verdict.status,
+           "length": verdict.length}
+    if verdict.received_fcs is not None:
+        row["received_fcs"] = f"0x{verdict.received_fcs:08X}"
+        row["calculated_fcs"] = f"0x{verdict.calculated_fcs:08X}"
+    return row
+
+
+def build_parser():
+    """Monta o parser da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Calculadora CRC-32 para redes Ethernet.")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--engine", choices=CRC32Calculator.ENGINES,
+                        default="zlib", help="engine de cálculo (padrão: zlib)")
+    common.add_argument("--jobs", type=int, default=1,
+                        help="processos em paralelo (padrão: 1)")
+    common.add_argument("--format", choices=("text", "json", "csv"),
+                        default="text", help="formato da saída")
+    
+    crc_parser = subparsers.add_parser(
+        "crc", parents=[common], help="calcula CRC-32 e FCS")
+    crc_parser.add_argument("files", nargs="*", metavar="FILE",
+                            help="arquivos ('-' para stdin)")
+    crc_parser.add_argument("--hex", action="append", default=[],
+                            help="dados em hexadecimal (pode repetir)")
+    crc_parser.add_argument("--stdin", action="store_true",
+                            help="lê os dados da entrada padrão")
+    crc_parser.add_argument("--reflected", action="store_true",
+                            help="usa o CRC refletido IEEE 802.3")
+    crc_parser.add_argument("--sparse", action="store_true",
+                            help="pula os buracos de arquivos esparsos")
+    crc_parser.set_defaults(handler=command_crc)
+    
+    validate_parser = subparsers.add_parser(
+        "validate", parents=[common], help="valida quadros e capturas")
+    validate_parser.add_argument("--pcap", action="append", metavar="FILE",
+                                 help="captura pcap/pcapng (pode repetir)")
+    validate_parser.add_argument("--fcs-len", type=int, default=None,
+                                 help="força o tamanho do FCS na captura")
+    convention = validate_parser.add_mutually_exclusive_group()
+    convention.add_argument("--reflected", dest="reflected", action="store_true",
+                            default=None,
+                            help="usa o CRC refletido IEEE 802.3 (padrão "
+                                 "para --pcap)")
+    convention.add_argument("--msb-first", dest="reflected", action="store_false",
+                            help="usa o CRC MSB-first (padrão para --hex)")
+    validate_parser.add_argument("--all", action="store_true",
+                                 help="lista todos os quadros, não só os com erro")
+    validate_parser.add_argument("--hex", help="dados do quadro em hexadecimal")
+    validate_parser.add_argument("--fcs", help="FCS recebido em hexadecimal")
+    validate_parser.set_defaults(handler=command_validate)
+    
+    menu_parser = subparsers.add_parser("menu", help="menu interativo")
+    menu_parser.set_defaults(handler=lambda args: menu_principal())
+    return parser
+
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando (sem argumentos: menu interativo)."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        menu_principal()
+        return 0
+    return args.handler(args) or 0
+
+
 if __name__ == "__main__":
-    menu_principal()
+    sys.exit(main())
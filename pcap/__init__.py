@@ -0,0 +1,52 @@
+"""
+Leitura de capturas (libpcap e pcapng) e validação de FCS em streaming.
+
+Exemplo:
+    verdicts, summary = validate_capture("captura.pcap", fcs_len=4)
+    for verdict in verdicts:
+        if verdict.status == "corrupted":
+            print(verdict.index)
+    print(summary)
+"""
+
+import os
+
+from pcap.pipeline import (CaptureValidator, FrameVerdict, ValidationSummary,
+                           locate_capture_bursts, validate_capture)
+from pcap.index import PacketIndex, index_path_for, validate_parallel
+from pcap.pcapng import PcapngReader
+from pcap.reader import LINKTYPE_ETHERNET, PcapReader, PcapRecord
+
+_PCAPNG_MAGIC = b"\x0a\x0d\x0d\x0a"
+
+
+def _peek_magic(source):
+    """Lê os 4 primeiros bytes da captura sem consumi-los."""
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, 'rb') as f:
+            return f.read(4)
+    if hasattr(source, "peek"):
+        return source.peek(4)[:4]
+    position = source.tell()
+    magic = source.read(4)
+    source.seek(position)
+    return magic
+
+
+def open_capture(source, fcs_len=None):
+    """
+    Abre uma captura detectando o formato (pcapng ou libpcap clássico).
+    Returns:
+        PcapReader ou PcapngReader
+    """
+    if _peek_magic(source) == _PCAPNG_MAGIC:
+        return PcapngReader(source, fcs_len=fcs_len)
+    return PcapReader(source, fcs_len=fcs_len)
+
+
+__all__ = [
+    "CaptureValidator", "FrameVerdict", "LINKTYPE_ETHERNET", "PacketIndex",
+    "PcapReader", "PcapRecord", "PcapngReader", "ValidationSummary",
+    "index_path_for", "locate_capture_bursts", "open_capture", "validate_capture",
+    "validate_parallel",
+]
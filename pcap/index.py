@@ -0,0 +1,298 @@
+"""Índice de pacotes para acesso aleatório e validação paralela."""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from main import CRC32Calculator, np
+from pcap.pipeline import FrameVerdict, ValidationSummary
+
+INDEX_MAGIC = b"CRCIDX01"
+# magic, tamanho da captura, mtime da captura (ns), quantidade de registros
+_HEADER = struct.Struct("<8sQQQ")
+# Tipo e tamanho (bytes) de cada coluna do índice, na ordem do arquivo
+_COLUMNS = (("offsets", 'Q', 8), ("caplens", 'I', 4), ("origlens", 'I', 4),
+            ("fcs_lens", 'B', 1))
+# Bytes por registro somando todas as colunas
+_ROW_SIZE = sum(size for _, _, size in _COLUMNS)
+
+
+def index_path_for(capture_path):
+    """Caminho padrão do índice ao lado da captura."""
+    return os.fspath(capture_path) + ".idx"
+
+
+def _column_positions(count):
+    """Posição inicial de cada coluna no arquivo de índice."""
+    positions = {}
+    position = _HEADER.size
+    for name, _, size in _COLUMNS:
+        positions[name] = position
+        position += size * count
+    return positions
+
+
+def _read_header(index_path):
+    """
+    Lê o cabeçalho do índice (ou None se ausente/inválido, inclusive se o
+    tamanho do arquivo não corresponder à quantidade de registros).
+    """
+    try:
+        with open(index_path, 'rb') as f:
+            raw = f.read(_HEADER.size)
+            file_size = os.fstat(f.fileno()).st_size
+    except FileNotFoundError:
+        return None
+    if len(raw) != _HEADER.size:
+        return None
+    magic, size, mtime, count = _HEADER.unpack(raw)
+    if magic != INDEX_MAGIC or file_size != _HEADER.size + _ROW_SIZE * count:
+        return None
+    return size, mtime, count
+
+
+def _is_current(header, capture_path):
+    """Confere se o índice corresponde ao estado atual da captura."""
+    stat = os.stat(capture_path)
+    return header is not None and header[:2] == (stat.st_size, stat.st_mtime_ns)
+
+
+def read_index_range(index_path, start, stop):
+    """
+    Lê apenas as entradas [start, stop) de um índice salvo.
+    Returns:
+        dict: coluna -> array com as entradas do intervalo
+    """
+    header = _read_header(index_path)
+    if header is None:
+        raise ValueError(f"Índice inválido: {index_path}")
+    count = header[2]
+    stop = min(stop, count)
+    positions = _column_positions(count)
+    columns = {}
+    with open(index_path, 'rb') as f:
+        for name, typecode, size in _COLUMNS:
+            column = array(typecode)
+            f.seek(positions[name] + start * size)
+            column.frombytes(f.read((stop - start) * size))
+            if sys.byteorder == "big" and size > 1:
+                column.byteswap()
+            columns[name] = column
+    return columns
+
+
+class PacketIndex:
+    """
+    Índice compacto dos registros de uma captura (pcap ou pcapng):
+    posição dos dados no arquivo, tamanho capturado, tamanho original e
+    tamanho do FCS de cada registro, em arrays.
+    O índice é salvo em um arquivo binário ao lado da captura e
+    reaproveitado enquanto a captura não mudar (tamanho e mtime).
+    """
+    __slots__ = ("offsets", "caplens", "origlens", "fcs_lens",
+                 "source_size", "source_mtime")
+    
+    def __init__(self):
+        self.offsets = array('Q')
+        self.caplens = array('I')
+        self.origlens = array('I')
+        self.fcs_lens = array('B')
+        self.source_size = 0
+        self.source_mtime = 0
+    
+    def __len__(self):
+        return len(self.offsets)
+    
+    @classmethod
+    def build(cls, capture_path):
+        """Percorre a captura uma vez e monta o índice."""
+        from pcap import open_capture
+
+        index = cls()
+        stat = os.stat(capture_path)
+        index.source_size = stat.st_size
+        index.source_mtime = stat.st_mtime_ns
+        with open_capture(capture_path) as reader:
+            for record in reader:
+                index.offsets.append(record.offset)
+                index.caplens.append(len(record.data))
+                index.origlens.append(record.orig_len)
+                index.fcs_lens.append(record.fcs_len)
+        return index
+    
+    def save(self, path):
+        """
+        Grava o índice (little-endian) em path. O arquivo é escrito ao lado
+        e renomeado no fim, para que uma gravação interrompida não deixe um
+        índice truncado no lugar do atual.
+        """
+        temporary = f"{os.fspath(path)}.{os.getpid()}.tmp"
+        try:
+            self._write(temporary)
+            os.replace(temporary, path)
+        except BaseException:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            raise
+    
+    def _write(self, path):
+        """Escreve o cabeçalho e as colunas do índice em path."""
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(INDEX_MAGIC, self.source_size,
+                                 self.source_mtime, len(self)))
+            for name, _, size in _COLUMNS:
+                column = getattr(self, name)
+                if sys.byteorder == "big" and size > 1:
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                column.tofile(f)
+    
+    @classmethod
+    def load(cls, path, capture_path=None):
+        """
+        Carrega um índice salvo.
+        Returns:
+            PacketIndex, ou None se o arquivo não existir, for inválido ou
+            estiver desatualizado em relação a capture_path
+        """
+        header = _read_header(path)
+        if header is None:
+            return None
+        if capture_path is not None and not _is_current(header, capture_path):
+            return None
+        index = cls()
+        index.source_size, index.source_mtime, count = header
+        columns = read_index_range(path, 0, count)
+        for name, _, _ in _COLUMNS:
+            setattr(index, name, columns[name])
+        return index
+    
+    @classmethod
+    def ensure(cls, capture_path, index_path=None):
+        """
+        Garante que existe um índice atualizado para a captura, criando-o
+        se necessário.
+        Returns:
+            tuple: (caminho do índice, quantidade de registros)
+        """
+        if index_path is None:
+            index_path = index_path_for(capture_path)
+        header = _read_header(index_path)
+        if _is_current(header, capture_path):
+            return index_path, header[2]
+        index = cls.build(capture_path)
+        index.save(index_path)
+        return index_path, len(index)
+
+
+def _validate_range(capture_path, index_path, start, stop, reflected, fcs_len,
+                    engine=None, verdicts=False):
+    """
+    Valida os registros [start, stop) de uma captura.
+    Executado nos processos de trabalho: cada um lê sua parte do índice e
+    mapeia a captura, de modo que nenhum byte de quadro é serializado.
+    Returns:
+        tuple: (contadores, números dos registros corrompidos ou, com
+        verdicts, FrameVerdict dos registros corrompidos e truncados)
+    """
+    columns = read_index_range(index_path, start, stop)
+    offsets, caplens = columns["offsets"], columns["caplens"]
+    origlens, fcs_lens = columns["origlens"], columns["fcs_lens"]
+    calculator = CRC32Calculator(reflected)
+    summary = ValidationSummary()
+    numbers, received = [], []
+    truncated = []
+    with open(capture_path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    frames = []
+    try:
+        for i, offset in enumerate(offsets):
+            caplen = caplens[i]
+            summary.frames += 1
+            summary.bytes += caplen
+            if (fcs_lens[i] if fcs_len is None else fcs_len) != 4:
+                summary.no_fcs += 1
+                continue
+            if caplen < origlens[i] or caplen < 4:
+                summary.truncated += 1
+                truncated.append(FrameVerdict(start + i, "truncated", caplen,
+                                              None, None))
+                continue
+            end = offset + caplen
+            frames.append(view[offset:end - 4])
+            received.append(calculator.fcs_from_bytes(view[end - 4:end]))
+            numbers.append(start + i)
+        if np is not None and frames:
+            is_valid, _, fcs = calculator.validate_frames(
+                frames, received, engine=engine)
+            is_valid, fcs = is_valid.tolist(), fcs.tolist()
+        else:
+            results = [calculator.validate_frame(frame, value)
+                       for frame, value in zip(frames, received)]
+            is_valid = [result[0] for result in results]
+            fcs = [result[2] for result in results]
+        lengths = [len(frame) + 4 for frame in frames]
+    finally:
+        frames.clear()
+        view.release()
+        mapped.close()
+    corrupted = [i for i, valid in enumerate(is_valid) if not valid]
+    summary.valid += len(numbers) - len(corrupted)
+    summary.corrupted += len(corrupted)
+    if not verdicts:
+        return summary.as_dict(), [numbers[i] for i in corrupted]
+    found = truncated + [FrameVerdict(numbers[i], "corrupted", lengths[i],
+                                      received[i], fcs[i]) for i in corrupted]
+    found.sort(key=lambda verdict: verdict.index)
+    return summary.as_dict(), found
+
+
+def validate_parallel(capture_path, workers=None, index_path=None,
+                      reflected=True, fcs_len=None, chunk_records=None,
+                      engine=None, verdicts=False):
+    """
+    Valida uma captura em vários processos usando o índice de pacotes.
+    Cada processo recebe um intervalo de números de registro, lê apenas
+    essa parte do índice e mapeia a captura por conta própria.
+    Args:
+        capture_path: caminho da captura (pcap ou pcapng)
+        workers: número de processos (padrão: os.cpu_count())
+        index_path: caminho do índice (padrão: captura + ".idx")
+        reflected: usa o CRC refletido IEEE 802.3
+        fcs_len: força o tamanho do FCS de todos os registros
+        chunk_records: registros por tarefa (padrão: ~4 tarefas por processo)
+        engine: engine repassado a validate_frames
+        verdicts: se True, retorna FrameVerdict dos registros corrompidos e
+            truncados em vez dos números dos corrompidos
+    Returns:
+        tuple: (ValidationSummary, lista dos registros corrompidos)
+    """
+    index_path, count = PacketIndex.ensure(capture_path, index_path)
+    workers = workers or os.cpu_count() or 1
+    if chunk_records is None:
+        chunk_records = max(1, -(-count // (workers * 4)))
+    starts = range(0, count, chunk_records)
+    stops = [min(start + chunk_records, count) for start in starts]
+    arguments = (repeat(capture_path), repeat(index_path), starts, stops,
+                 repeat(reflected), repeat(fcs_len), repeat(engine),
+                 repeat(verdicts))
+    summary = ValidationSummary()
+    corrupted = []
+    if workers == 1 or len(stops) <= 1:
+        results = map(_validate_range, *arguments)
+        for counters, numbers in results:
+            summary.update(counters)
+            corrupted.extend(numbers)
+        return summary, corrupted
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for counters, numbers in executor.map(_validate_range, *arguments):
+            summary.update(counters)
+            corrupted.extend(numbers)
+    return summary, corrupted
@@ -0,0 +1,232 @@
+"""Leitura de arquivos pcapng sem cópia dos dados dos pacotes."""
+
+import mmap
+import os
+import struct
+
+from pcap.reader import PcapRecord, _read_exact
+
+BLOCK_SHB = 0x0A0D0D0A
+BLOCK_IDB = 0x00000001
+BLOCK_PB = 0x00000002
+BLOCK_SPB = 0x00000003
+BLOCK_EPB = 0x00000006
+
+# Maior bloco aceito (mesmo limite do libpcap/Wireshark): o tamanho vem do
+# arquivo e não deve ditar alocações arbitrárias
+MAX_BLOCK_SIZE = 16 << 20
+
+OPTION_END = 0
+OPTION_IF_TSRESOL = 9
+OPTION_IF_FCSLEN = 13
+
+# Tamanho mínimo de cada bloco (cabeçalho, campos fixos e tamanho final)
+_MIN_BLOCK_LENGTH = {BLOCK_EPB: 32, BLOCK_PB: 32, BLOCK_SPB: 16, BLOCK_IDB: 20}
+
+_SHB_TYPE = struct.pack("<I", BLOCK_SHB)
+_BYTE_ORDER_MAGIC = {b"\x4d\x3c\x2b\x1a": "<", b"\x1a\x2b\x3c\x4d": ">"}
+
+
+class _Interface:
+    """Parâmetros de uma interface declarada em um IDB."""
+    __slots__ = ("linktype", "snaplen", "fcs_len", "resolution")
+    
+    def __init__(self, linktype, snaplen, fcs_len, resolution):
+        self.linktype = linktype
+        self.snaplen = snaplen
+        self.fcs_len = fcs_len
+        self.resolution = resolution
+
+
+def _parse_options(block, start, end, endian):
+    """
+    Percorre as opções (código, tamanho, valor alinhado a 4 bytes).
+    Yields:
+        tuple: (código, memoryview do valor)
+    """
+    while start + 4 <= end:
+        code, length = struct.unpack_from(endian + "HH", block, start)
+        if code == OPTION_END:
+            return
+        start += 4
+        yield code, block[start:start + length]
+        start += (length + 3) & ~3
+
+
+class PcapngReader:
+    """
+    Lê os pacotes de um arquivo pcapng (vários Section Header Blocks e
+    interfaces, Enhanced/Simple/Packet Blocks).
+    O arquivo é mapeado com mmap e os blocos são interpretados com
+    struct.unpack_from; os dados de cada pacote são fatias memoryview do
+    mapeamento, sem cópia. Fontes não mapeáveis (pipes) são lidas bloco a
+    bloco em um buffer reaproveitado.
+    """
+    
+    def __init__(self, source, fcs_len=None):
+        """
+        Args:
+            source: caminho do arquivo ou arquivo binário aberto
+            fcs_len: força o tamanho do FCS de todas as interfaces; se
+                None, usa a opção if_fcslen de cada interface (ou 0)
+        """
+        if isinstance(source, (str, bytes, os.PathLike)):
+            self._file = open(source, 'rb')
+            self._owns_file = True
+        else:
+            self._file = source
+            self._owns_file = False
+        self.fcs_len = fcs_len
+        self._mapped = None
+        self._view = None
+        try:
+            self._mapped = mmap.mmap(self._file.fileno(), 0,
+                                     access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mapped)
+        except (OSError, ValueError, AttributeError):
+            pass
+    
+    @property
+    def stable_views(self):
+        """
+        True quando os dados dos pacotes são fatias do mapeamento (válidas
+        até close()); False quando vêm de um buffer reaproveitado.
+        """
+        return self._view is not None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mapped is not None:
+            try:
+                self._mapped.close()
+            except BufferError:
+                # Ainda há fatias em uso; o mapeamento é liberado pelo GC
+                pass
+            self._mapped = None
+        if self._owns_file:
+            self._file.close()
+    
+    def _blocks_mapped(self):
+        """Percorre os blocos do arquivo mapeado."""
+        view = self._view
+        size = len(view)
+        endian = "<"
+        position = 0
+        while position + 12 <= size:
+            if view[position:position + 4] == _SHB_TYPE:
+                endian = self._section_endian(view[position + 8:position + 12])
+            block_type, length = struct.unpack_from(endian + "II", view, position)
+            if (length < 12 or length & 3 or length > MAX_BLOCK_SIZE
+                    or position + length > size):
+                raise ValueError(f"Bloco pcapng inválido na posição {position}")
+            yield block_type, view[position:position + length], endian, position
+            position += length
+    
+    def _blocks_stream(self):
+        """Percorre os blocos lendo cada um em um buffer reaproveitado."""
+        buffer = bytearray(65536)
+        view = memoryview(buffer)
+        endian = "<"
+        position = 0
+        while True:
+            count = _read_exact(self._file, view[:12])
+            if count == 0:
+                return
+            if count != 12:
+                raise ValueError("Bloco pcapng truncado")
+            if view[:4] == _SHB_TYPE:
+                endian = self._section_endian(view[8:12])
+            block_type, length = struct.unpack_from(endian + "II", view)
+            if length < 12 or length & 3 or length > MAX_BLOCK_SIZE:
+                raise ValueError(f"Bloco pcapng inválido na posição {position}")
+            if length > len(buffer):
+                header = bytes(view[:12])
+                view.release()
+                buffer = bytearray(length)
+                buffer[:12] = header
+                view = memoryview(buffer)
+            if _read_exact(self._file, view[12:length]) != length - 12:
+                raise ValueError("Bloco pcapng truncado")
+            yield block_type, view[:length], endian, position
+            position += length
+    
+    @staticmethod
+    def _section_endian(magic):
+        try:
+            return _BYTE_ORDER_MAGIC[bytes(magic)]
+        except KeyError:
+            raise ValueError("Byte-order magic pcapng inválido") from None
+    
+    def _parse_interface(self, block, endian):
+        """Interpreta um Interface Description Block."""
+        linktype, _, snaplen = struct.unpack_from(endian + "HHI", block, 8)
+        fcs_len = 0
+        resolution = 1e-6
+        for code, value in _parse_options(block, 16, len(block) - 4, endian):
+            if code == OPTION_IF_FCSLEN and len(value) >= 1:
+                fcs_len = value[0]
+            elif code == OPTION_IF_TSRESOL and len(value) >= 1:
+                exponent = value[0]
+                if exponent & 0x80:
+                    resolution = 2.0 ** -(exponent & 0x7F)
+                else:
+                    resolution = 10.0 ** -exponent
+        if self.fcs_len is not None:
+            fcs_len = self.fcs_len
+        return _Interface(linktype, snaplen, fcs_len, resolution)
+    
+    def __iter__(self):
+        blocks = self._blocks_mapped() if self._view is not None \
+            else self._blocks_stream()
+        interfaces = []
+        index = 0
+        unpack_from = struct.unpack_from
+        for block_type, block, endian, position in blocks:
+            if len(block) < _MIN_BLOCK_LENGTH.get(block_type, 12):
+                raise ValueError(f"Bloco pcapng curto demais na posição {position}")
+            if block_type == BLOCK_EPB:
+                (interface_id, ts_high, ts_low, caplen,
+                 orig_len) = unpack_from(endian + "IIIII", block, 8)
+                start = 28
+            elif block_type == BLOCK_SPB:
+                interface_id = 0
+                ts_high = ts_low = 0
+                (orig_len,) = unpack_from(endian + "I", block, 8)
+                caplen = min(orig_len, len(block) - 16)
+                if interfaces and interfaces[0].snaplen:
+                    caplen = min(caplen, interfaces[0].snaplen)
+                start = 12
+            elif block_type == BLOCK_PB:
+                (interface_id, _, ts_high, ts_low, caplen,
+                 orig_len) = unpack_from(endian + "HHIIII", block, 8)
+                start = 28
+            elif block_type == BLOCK_IDB:
+                interfaces.append(self._parse_interface(block, endian))
+                continue
+            elif block_type == BLOCK_SHB:
+                interfaces = []
+                continue
+            else:
+                continue
+            # Os dados (alinhados a 4 bytes) devem caber antes do tamanho final
+            if start + ((caplen + 3) & ~3) > len(block) - 4:
+                raise ValueError(f"Pacote {index} com caplen {caplen} maior "
+                                 f"que o bloco na posição {position}")
+            try:
+                interface = interfaces[interface_id]
+            except IndexError:
+                raise ValueError(
+                    f"Pacote {index} referencia interface inexistente") from None
+            timestamp = ((ts_high << 32) | ts_low) * interface.resolution
+            yield PcapRecord(index, timestamp, interface.linktype,
+                             interface.fcs_len, block[start:start + caplen],
+                             orig_len, position + start)
+            index += 1
@@ -0,0 +1,215 @@
+"""Pipeline de validação de FCS para capturas."""
+
+from array import array
+from collections import namedtuple
+
+from main import CRC32Calculator, np
+
+# Veredito de um quadro. status: "valid", "corrupted", "truncated"
+# (registro capturado sem o FCS completo) ou "no_fcs".
+FrameVerdict = namedtuple(
+    "FrameVerdict", "index status length received_fcs calculated_fcs")
+
+
+class ValidationSummary:
+    """Contadores acumulados da validação de uma captura."""
+    
+    FIELDS = ("frames", "valid", "corrupted", "truncated", "no_fcs", "bytes")
+    
+    def __init__(self):
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+    
+    def update(self, counters):
+        """Soma contadores (ex.: de outro processo) a este resumo."""
+        for field in self.FIELDS:
+            setattr(self, field, getattr(self, field) + counters.get(field, 0))
+    
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+    
+    def __repr__(self):
+        counters = ", ".join(f"{key}={value}" for key, value in self.as_dict().items())
+        return f"ValidationSummary({counters})"
+
+
+class CaptureValidator:
+    """
+    Valida o FCS dos quadros de uma captura em lotes com
+    CRC32Calculator.validate_frames (ou quadro a quadro sem NumPy).
+    Quando o leitor reaproveita seu buffer, os quadros (sem o FCS) são
+    copiados para um único buffer de lote pré-alocado; quando o leitor
+    entrega fatias estáveis (stable_views, ex.: pcapng mapeado com mmap),
+    as fatias são validadas diretamente, sem cópia.
+    A memória fica limitada ao tamanho do lote.
+    """
+    
+    def __init__(self, calculator=None, batch_frames=4096,
+                 batch_bytes=4 << 20, engine=None):
+        """
+        Args:
+            calculator: CRC32Calculator (padrão: modo refletido IEEE 802.3)
+            batch_frames: quantidade máxima de quadros por lote
+            batch_bytes: tamanho do buffer de lote
+            engine: engine repassado a validate_frames
+        """
+        if calculator is None:
+            calculator = CRC32Calculator(reflected=True)
+        self.calculator = calculator
+        self.batch_frames = batch_frames
+        self.engine = engine
+        self.summary = ValidationSummary()
+        self._buffer = bytearray(batch_bytes)
+        self._offsets = array('Q', [0])
+        self._frames = []
+        self._received = array('I')
+        self._indices = []
+    
+    def validate(self, records):
+        """
+        Valida uma sequência de PcapRecord.
+        Yields:
+            FrameVerdict: um veredito por registro, na ordem da captura
+        """
+        stable = getattr(records, "stable_views", False)
+        fcs_from_bytes = self.calculator.fcs_from_bytes
+        summary = self.summary
+        pending = []  # vereditos que não dependem do lote atual
+        try:
+            for record in records:
+                data = record.data
+                summary.frames += 1
+                summary.bytes += len(data)
+                if record.fcs_len != 4:
+                    summary.no_fcs += 1
+                    pending.append(FrameVerdict(record.index, "no_fcs",
+                                                len(data), None, None))
+                    continue
+                if len(data) < record.orig_len or len(data) < 4:
+                    summary.truncated += 1
+                    pending.append(FrameVerdict(record.index, "truncated",
+                                                len(data), None, None))
+                    continue
+                payload = data[:-4]
+                if stable:
+                    if len(self._indices) >= self.batch_frames:
+                        yield from self._flush(pending)
+                        pending = []
+                    self._frames.append(payload)
+                else:
+                    start = self._offsets[-1]
+                    if (len(self._indices) >= self.batch_frames
+                            or start + len(payload) > len(self._buffer)):
+                        yield from self._flush(pending)
+                        pending = []
+                        start = 0
+                    if len(payload) > len(self._buffer):
+                        self._buffer = bytearray(len(payload))
+                    self._buffer[start:start + len(payload)] = payload
+                    self._offsets.append(start + len(payload))
+                self._received.append(fcs_from_bytes(data[-4:]))
+                self._indices.append(record.index)
+                pending.append(None)  # posição reservada para o veredito do lote
+        except ValueError:
+            # Captura malformada: valida o lote já acumulado para que os
+            # vereditos e o resumo parcial fiquem coerentes antes do erro
+            yield from self._flush(pending)
+            raise
+        yield from self._flush(pending)
+    
+    def _flush(self, pending):
+        """Valida o lote acumulado e emite os vereditos em ordem."""
+        if not self._frames:
+            view = memoryview(self._buffer)
+            offsets = self._offsets
+            self._frames = [view[offsets[i]:offsets[i + 1]]
+                            for i in range(len(offsets) - 1)]
+        results = iter(self._validate_batch(self._frames))
+        for verdict in pending:
+            yield next(results) if verdict is None else verdict
+        self._frames = []
+        del self._offsets[1:]
+        del self._received[:]
+        self._indices.clear()
+    
+    def _validate_batch(self, frames):
+        """Valida os quadros do lote atual."""
+        if not frames:
+            return []
+        received = self._received
+        if np is not None:
+            is_valid, _, fcs = self.calculator.validate_frames(
+                frames, received, engine=self.engine)
+            is_valid = is_valid.tolist()
+            fcs = fcs.tolist()
+        else:
+            is_valid, fcs = [], []
+            for frame, value in zip(frames, received):
+                valid, _, calculated = self.calculator.validate_frame(frame, value)
+                is_valid.append(valid)
+                fcs.append(calculated)
+        summary = self.summary
+        verdicts = []
+        for i, frame in enumerate(frames):
+            if is_valid[i]:
+                summary.valid += 1
+                status = "valid"
+            else:
+                summary.corrupted += 1
+                status = "corrupted"
+            verdicts.append(FrameVerdict(self._indices[i], status,
+                                         len(frame) + 4, received[i], fcs[i]))
+        return verdicts
+
+
+def validate_capture(source, calculator=None, fcs_len=None, **options):
+    """
+    Valida todos os quadros de uma captura.
+    Args:
+        source: caminho ou arquivo binário da captura
+        calculator: CRC32Calculator (padrão: modo refletido IEEE 802.3)
+        fcs_len: força o tamanho do FCS (padrão: valor do cabeçalho)
+        options: repassadas a CaptureValidator
+    Returns:
+        tuple: (iterador de FrameVerdict, ValidationSummary atualizado
+        à medida que o iterador é consumido)
+    """
+    from pcap import open_capture
+
+    validator = CaptureValidator(calculator, **options)
+
+    def verdicts():
+        with open_capture(source, fcs_len=fcs_len) as reader:
+            yield from validator.validate(reader)
+
+    return verdicts(), validator.summary
+
+
+def locate_capture_bursts(source, calculator=None, fcs_len=None, max_burst=32,
+                          **options):
+    """
+    Valida uma captura e localiza as rajadas de erro candidatas de cada
+    quadro corrompido. As rajadas são derivadas dos FCS já presentes no
+    veredito (CRC32Calculator.bursts_from_fcs), sem recalcular o CRC.
+    Args:
+        source: caminho ou arquivo binário da captura
+        calculator: CRC32Calculator (padrão: modo refletido IEEE 802.3)
+        fcs_len: força o tamanho do FCS (padrão: valor do cabeçalho)
+        max_burst: comprimento máximo da rajada (1 a 32 bits)
+        options: repassadas a CaptureValidator
+    Returns:
+        tuple: (iterador de (FrameVerdict, lista de Burst) dos quadros
+        corrompidos, ValidationSummary)
+    """
+    verdicts, summary = validate_capture(source, calculator, fcs_len, **options)
+    if calculator is None:
+        calculator = CRC32Calculator(reflected=True)
+
+    def bursts():
+        for verdict in verdicts:
+            if verdict.status == "corrupted":
+                yield verdict, calculator.bursts_from_fcs(
+                    verdict.length - 4, verdict.received_fcs,
+                    verdict.calculated_fcs, max_burst)
+
+    return bursts(), summary
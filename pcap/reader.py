@@ -0,0 +1,138 @@
+"""Leitura em streaming de arquivos libpcap clássicos."""
+
+import os
+import struct
+from collections import namedtuple
+
+# Registro de captura. `data` é um memoryview de um buffer reaproveitado:
+# só é válido até a leitura do próximo registro. `offset` é a posição dos
+# dados do pacote no arquivo.
+PcapRecord = namedtuple(
+    "PcapRecord", "index timestamp linktype fcs_len data orig_len offset")
+
+LINKTYPE_ETHERNET = 1
+
+# Maior incl_len aceito quando o snaplen do cabeçalho é menor (valor usado
+# pelo tcpdump/libpcap como snaplen máximo)
+MAX_SNAPLEN = 262144
+
+# Magic number -> (ordem dos bytes, resolução do timestamp)
+PCAP_MAGIC = {
+    b"\xd4\xc3\xb2\xa1": ("<", 1e-6),
+    b"\xa1\xb2\xc3\xd4": (">", 1e-6),
+    b"\x4d\x3c\xb2\xa1": ("<", 1e-9),
+    b"\xa1\xb2\x3c\x4d": (">", 1e-9),
+}
+
+
+def _read_exact(f, view):
+    """
+    Preenche o memoryview com readinto (tolerando leituras parciais de
+    pipes). Retorna a quantidade de bytes lidos.
+    """
+    total = 0
+    while total < len(view):
+        count = f.readinto(view[total:])
+        if not count:
+            break
+        total += count
+    return total
+
+
+class PcapReader:
+    """
+    Lê os registros de um arquivo libpcap clássico (ambas as ordens de
+    bytes, timestamps em micro ou nanossegundos).
+    Os cabeçalhos e os dados de cada registro são lidos com readinto em
+    buffers reaproveitados, de modo que a memória não cresce com o
+    tamanho da captura.
+    Uma captura cortada no meio de um registro (ex.: tcpdump interrompido)
+    termina com um último registro parcial, com menos bytes que orig_len,
+    e o atributo truncated passa a True.
+    """
+    
+    def __init__(self, source, fcs_len=None):
+        """
+        Args:
+            source: caminho do arquivo ou arquivo binário aberto
+            fcs_len: bytes de FCS no final de cada quadro; se None, usa o
+                valor indicado no cabeçalho (bit F do campo de link type)
+        """
+        if isinstance(source, (str, bytes, os.PathLike)):
+            self._file = open(source, 'rb')
+            self._owns_file = True
+        else:
+            self._file = source
+            self._owns_file = False
+        header = bytearray(24)
+        if _read_exact(self._file, memoryview(header)) != 24:
+            self.close()
+            raise ValueError("Arquivo pcap truncado (cabeçalho global)")
+        try:
+            endian, self.resolution = PCAP_MAGIC[bytes(header[:4])]
+        except KeyError:
+            self.close()
+            raise ValueError("Magic number pcap inválido") from None
+        (self.version_major, self.version_minor, _, _, self.snaplen,
+         network) = struct.unpack_from(endian + "HHiIII", header, 4)
+        self.linktype = network & 0xFFFF
+        if fcs_len is None:
+            # Bit F (28) indica a presença de FCS; bits 29-31 dão o tamanho
+            # em palavras de 16 bits
+            fcs_len = 2 * ((network >> 29) & 0x7) if network & (1 << 28) else 0
+        self.fcs_len = fcs_len
+        self._record_header = struct.Struct(endian + "IIII")
+        # Começa com 64 KiB e cresce sob demanda: o snaplen do cabeçalho pode
+        # ser enorme (ou lixo) e não deve ditar uma alocação antecipada
+        self._buffer = bytearray(65535)
+        self.truncated = False
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        if self._owns_file:
+            self._file.close()
+    
+    def __iter__(self):
+        header = bytearray(self._record_header.size)
+        header_view = memoryview(header)
+        view = memoryview(self._buffer)
+        index = 0
+        offset = 24 + len(header)
+        while True:
+            count = _read_exact(self._file, header_view)
+            if count == 0:
+                return
+            if count != len(header):
+                # Cabeçalho do registro cortado: registro vazio e truncado
+                self.truncated = True
+                yield PcapRecord(index, 0.0, self.linktype, self.fcs_len,
+                                 view[:0], 0, offset)
+                return
+            seconds, fraction, incl_len, orig_len = \
+                self._record_header.unpack_from(header)
+            if incl_len > max(self.snaplen, MAX_SNAPLEN):
+                raise ValueError(f"Registro {index} com tamanho inválido "
+                                 f"({incl_len} bytes)")
+            if incl_len > len(self._buffer):
+                view.release()
+                self._buffer = bytearray(incl_len)
+                view = memoryview(self._buffer)
+            data = view[:incl_len]
+            count = _read_exact(self._file, data)
+            timestamp = seconds + fraction * self.resolution
+            if count != incl_len:
+                # Dados cortados: entrega o que foi lido como registro
+                # truncado (orig_len nunca menor que o registro completo)
+                self.truncated = True
+                yield PcapRecord(index, timestamp, self.linktype, self.fcs_len,
+                                 data[:count], max(orig_len, incl_len), offset)
+                return
+            yield PcapRecord(index, timestamp, self.linktype, self.fcs_len,
+                             data, orig_len, offset)
+            index += 1
+            offset += incl_len + len(header)